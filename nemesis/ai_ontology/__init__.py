@@ -7,6 +7,7 @@ from .semantic_understanding import (
     SemanticUnderstandingLayer,
     MultiModalIntelligenceProcessor,
     ExtractedEntity,
+    EntityBatch,
     EntityType
 )
 
@@ -63,6 +64,7 @@ __all__ = [
     "SemanticUnderstandingLayer",
     "MultiModalIntelligenceProcessor",
     "ExtractedEntity",
+    "EntityBatch",
     "EntityType",
     "AutoClassificationSystem",
     "ThreatClassification",
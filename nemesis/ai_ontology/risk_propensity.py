@@ -6,6 +6,7 @@ Assesses mobilization index, volatility score, and behavioral similarity
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import numpy as np
 
 
 @dataclass
@@ -67,6 +68,21 @@ class RiskPropensityModel:
                 ]
             }
         }
+        
+        # Indicator sets normalized once for O(1) membership
+        self._pattern_indicator_sets = {
+            pattern_id: frozenset(pattern_info["indicators"])
+            for pattern_id, pattern_info in self.known_patterns.items()
+        }
+        
+        # Indicator checks by name; indicators without a check never match
+        self._indicator_checks = {
+            "rapid_chain_switching": lambda sig, txs, cache: (
+                sig.get("traits", {}).get("chain_switching_frequency", 0) > 0.7
+            ),
+            "mixer_usage": lambda sig, txs, cache: "mixer_usage" in cache["tx_types"],
+            "exchange_deposit_preparation": lambda sig, txs, cache: self._detect_exchange_preparation(txs) > 0.5,
+        }
     
     def assess_risk_propensity(
         self,
@@ -133,6 +149,54 @@ class RiskPropensityModel:
             reasoning=reasoning
         )
     
+    def score_batch(
+        self,
+        behavioral_signatures: List[Dict[str, Any]],
+        transaction_histories: List[List[Dict[str, Any]]],
+        network_data: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score many actors at once
+        
+        Args:
+            behavioral_signatures: One behavioral signature per actor
+            transaction_histories: One transaction history per actor
+            network_data: Optional Echo network data per actor
+        
+        Returns:
+            Dict of mobilization_index, volatility_score and overall_risk_score
+            arrays, aligned with the input order
+        """
+        count = len(behavioral_signatures)
+        if network_data is None:
+            network_data = [None] * count
+        
+        mob_vec = np.empty(count)
+        vol_vec = np.empty(count)
+        sim_vec = np.zeros(count)
+        
+        for i, (signature, transactions, network) in enumerate(
+            zip(behavioral_signatures, transaction_histories, network_data, strict=True)
+        ):
+            mob_vec[i] = self._sum_mobilization_indicators(signature, transactions, network)
+            vol_vec[i] = self._sum_volatility_indicators(signature, transactions)
+            similarity = self._calculate_behavioral_similarity(signature, transactions, None)
+            if similarity:
+                sim_vec[i] = max(similarity.values())
+        
+        # Clamp in place as fused vector ops instead of per-actor min()
+        np.clip(mob_vec, 0.0, 1.0, out=mob_vec)
+        np.clip(vol_vec, 0.0, 1.0, out=vol_vec)
+        
+        risk_vec = mob_vec * 0.5 + vol_vec * 0.3 + sim_vec * 0.2
+        np.clip(risk_vec, 0.0, 1.0, out=risk_vec)
+        
+        return {
+            "mobilization_index": mob_vec,
+            "volatility_score": vol_vec,
+            "overall_risk_score": risk_vec
+        }
+    
     def _calculate_mobilization_index(
         self,
         signature: Dict[str, Any],
@@ -143,6 +207,15 @@ class RiskPropensityModel:
         Calculate mobilization index: How close actor is to attack staging (0-1)
         Higher = closer to staging behavior
         """
+        return min(self._sum_mobilization_indicators(signature, transactions, network_data), 1.0)
+    
+    def _sum_mobilization_indicators(
+        self,
+        signature: Dict[str, Any],
+        transactions: List[Dict[str, Any]],
+        network_data: Optional[Dict[str, Any]]
+    ) -> float:
+        """Weighted sum of mobilization indicators (unclamped)"""
         indicators = []
         
         # Flight risk indicator
@@ -168,8 +241,7 @@ class RiskPropensityModel:
             indicators.append(("exchange_prep", exchange_prep * 0.25))
         
         # Sum weighted indicators
-        mobilization_index = sum(weight for _, weight in indicators)
-        return min(mobilization_index, 1.0)
+        return sum(weight for _, weight in indicators)
     
     def _calculate_volatility_score(
         self,
@@ -179,6 +251,14 @@ class RiskPropensityModel:
         """
         Calculate volatility score: Likelihood of action (not timing) (0-1)
         """
+        return min(self._sum_volatility_indicators(signature, transactions), 1.0)
+    
+    def _sum_volatility_indicators(
+        self,
+        signature: Dict[str, Any],
+        transactions: List[Dict[str, Any]]
+    ) -> float:
+        """Weighted sum of volatility indicators (unclamped)"""
         indicators = []
         
         # Risk tolerance
@@ -198,8 +278,7 @@ class RiskPropensityModel:
         route_entropy = signature.get("traits", {}).get("route_entropy", 0.0)
         indicators.append(route_entropy * 0.25)
         
-        volatility_score = sum(indicators)
-        return min(volatility_score, 1.0)
+        return sum(indicators)
     
     def _calculate_behavioral_similarity(
         self,
@@ -213,9 +292,12 @@ class RiskPropensityModel:
         """
         similarities = {}
         
+        # Per-call facts shared across all indicator checks
+        cache = {"tx_types": {tx.get("type") for tx in transactions}}
+        
         # Match against known patterns
-        for pattern_id, pattern_info in self.known_patterns.items():
-            similarity = self._match_pattern(signature, transactions, pattern_info)
+        for pattern_id in self.known_patterns:
+            similarity = self._match_pattern(signature, transactions, pattern_id, cache)
             if similarity > 0.6:  # Only include significant matches
                 similarities[pattern_id] = similarity
         
@@ -314,18 +396,25 @@ class RiskPropensityModel:
     # Helper methods
     def _analyze_recent_activity_spike(self, transactions: List[Dict[str, Any]]) -> float:
         """Analyze if there's a recent activity spike"""
-        if len(transactions) < 2:
+        count = len(transactions)
+        if count < 2:
             return 0.0
         
-        # Compare recent activity to historical average
-        recent_count = len([tx for tx in transactions[-10:]])
-        avg_count = len(transactions) / max(len(transactions), 1)
+        timestamps = np.sort(np.fromiter(
+            (tx.get("timestamp", 0) for tx in transactions), dtype=float, count=count
+        ))
+        span = timestamps[-1] - timestamps[0]
+        if span <= 0:
+            return 0.0
         
-        if avg_count > 0:
-            spike_ratio = recent_count / avg_count
-            return min(spike_ratio / 2.0, 1.0)  # Normalize
+        # Compare transaction rate in the final tenth of the observed span
+        # against the rate over the preceding nine tenths
+        cutoff = timestamps[-1] - span / 10
+        recent_count = count - int(np.searchsorted(timestamps, cutoff, side="left"))
+        prior_count = count - recent_count  # >= 1, the earliest tx precedes cutoff
         
-        return 0.0
+        spike_ratio = (recent_count / (span / 10)) / (prior_count / (span * 0.9))
+        return min(spike_ratio / 2.0, 1.0)  # Normalize
     
     def _detect_exchange_preparation(self, transactions: List[Dict[str, Any]]) -> float:
         """Detect if actor is preparing for exchange deposit"""
@@ -360,25 +449,24 @@ class RiskPropensityModel:
         self,
         signature: Dict[str, Any],
         transactions: List[Dict[str, Any]],
-        pattern_info: Dict[str, Any]
+        pattern_id: str,
+        cache: Dict[str, Any]
     ) -> float:
         """Match actor against known pattern"""
-        indicators = pattern_info.get("indicators", [])
-        matches = 0
-        
-        for indicator in indicators:
-            if indicator == "rapid_chain_switching":
-                if signature.get("traits", {}).get("chain_switching_frequency", 0) > 0.7:
-                    matches += 1
-            elif indicator == "mixer_usage":
-                if any(tx.get("type") == "mixer_usage" for tx in transactions):
-                    matches += 1
-            elif indicator == "exchange_deposit_preparation":
-                if self._detect_exchange_preparation(transactions) > 0.5:
-                    matches += 1
-            # Add more indicator checks
-        
-        return matches / len(indicators) if indicators else 0.0
+        indicators = self._pattern_indicator_sets.get(pattern_id)
+        if indicators is None:
+            indicators = frozenset(self.known_patterns[pattern_id].get("indicators", []))
+            self._pattern_indicator_sets[pattern_id] = indicators
+        
+        if not indicators:
+            return 0.0
+        
+        matches = sum(
+            1 for indicator in indicators
+            if indicator in self._indicator_checks
+            and self._indicator_checks[indicator](signature, transactions, cache)
+        )
+        return matches / len(indicators)
     
     def _match_historical_pattern(
         self,
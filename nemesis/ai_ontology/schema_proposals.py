@@ -7,6 +7,8 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
+import secrets
+import numpy as np
 
 
 class ProposalStatus(Enum):
@@ -41,6 +43,13 @@ class SchemaProposal:
             self.proposed_at = datetime.now()
 
 
+# Compact uint8 codes for the columnar status array
+_STATUS_CODES = {status: code for code, status in enumerate(ProposalStatus)}
+
+# Status by code, the inverse of _STATUS_CODES
+_STATUSES = tuple(ProposalStatus)
+
+
 class SchemaProposalSystem:
     """
     Human-gated schema evolution system
@@ -49,9 +58,59 @@ class SchemaProposalSystem:
     """
     
     def __init__(self):
+        # Columnar layout: proposals by position plus a parallel status array,
+        # so status scans touch one contiguous buffer instead of every object.
+        # The array is authoritative; SchemaProposal.status mirrors it and is
+        # only ever written through _set_status
+        self._proposal_list: List[SchemaProposal] = []
+        self._status_arr = np.zeros(64, dtype=np.uint8)
+        self._id_to_idx: Dict[str, int] = {}
         self.proposals: Dict[str, SchemaProposal] = {}
         self.implemented_proposals: Dict[str, SchemaProposal] = {}
     
+    def _add_proposal(self, proposal: SchemaProposal):
+        """Append proposal and its status code, growing the status array geometrically"""
+        idx = len(self._proposal_list)
+        if idx == len(self._status_arr):
+            grown = np.zeros(2 * len(self._status_arr), dtype=np.uint8)
+            grown[:idx] = self._status_arr
+            self._status_arr = grown
+        
+        self._proposal_list.append(proposal)
+        self._id_to_idx[proposal.proposal_id] = idx
+        self.proposals[proposal.proposal_id] = proposal
+        self._set_status(idx, proposal.status)
+    
+    def _status_at(self, idx: int) -> ProposalStatus:
+        """Current status of the proposal at idx"""
+        return _STATUSES[self._status_arr[idx]]
+    
+    def _active_index(self, proposal_id: str) -> Optional[int]:
+        """Position of a not-yet-implemented proposal, or None"""
+        idx = self._id_to_idx.get(proposal_id)
+        if idx is None or self._status_at(idx) == ProposalStatus.IMPLEMENTED:
+            return None
+        return idx
+    
+    def _set_status(self, idx: int, status: ProposalStatus) -> SchemaProposal:
+        """Transition proposal at idx; the only writer of proposal status"""
+        self._status_arr[idx] = _STATUS_CODES[status]
+        proposal = self._proposal_list[idx]
+        proposal.status = status
+        return proposal
+    
+    def _proposals_with_status(self, status: ProposalStatus) -> List[SchemaProposal]:
+        """All proposals currently in the given status"""
+        count = len(self._proposal_list)
+        matches = np.nonzero(self._status_arr[:count] == _STATUS_CODES[status])[0]
+        return [self._proposal_list[i] for i in matches]
+    
+    def _status_counts(self) -> Dict[ProposalStatus, int]:
+        """Number of proposals in each status"""
+        count = len(self._proposal_list)
+        counts = np.bincount(self._status_arr[:count], minlength=len(_STATUS_CODES))
+        return {status: int(counts[code]) for status, code in _STATUS_CODES.items()}
+    
     def propose_schema_change(
         self,
         proposal_type: str,
@@ -75,8 +134,7 @@ class SchemaProposalSystem:
         Returns:
             SchemaProposal object
         """
-        import uuid
-        proposal_id = f"proposal_{uuid.uuid4().hex[:16]}"
+        proposal_id = f"proposal_{secrets.token_hex(8)}"
         
         proposal = SchemaProposal(
             proposal_id=proposal_id,
@@ -89,19 +147,17 @@ class SchemaProposalSystem:
             proposed_at=datetime.now()
         )
         
-        self.proposals[proposal_id] = proposal
+        self._add_proposal(proposal)
         return proposal
     
     def get_pending_proposals(self) -> List[SchemaProposal]:
         """Get all pending proposals awaiting review"""
-        return [
-            proposal for proposal in self.proposals.values()
-            if proposal.status == ProposalStatus.PENDING
-        ]
+        return self._proposals_with_status(ProposalStatus.PENDING)
     
     def get_proposal(self, proposal_id: str) -> Optional[SchemaProposal]:
         """Get proposal by ID"""
-        return self.proposals.get(proposal_id) or self.implemented_proposals.get(proposal_id)
+        idx = self._id_to_idx.get(proposal_id)
+        return self._proposal_list[idx] if idx is not None else None
     
     def approve_proposal(
         self,
@@ -120,11 +176,11 @@ class SchemaProposalSystem:
         Returns:
             True if approved, False if not found
         """
-        if proposal_id not in self.proposals:
+        idx = self._active_index(proposal_id)
+        if idx is None:
             return False
         
-        proposal = self.proposals[proposal_id]
-        proposal.status = ProposalStatus.APPROVED
+        proposal = self._set_status(idx, ProposalStatus.APPROVED)
         proposal.reviewed_by = reviewer_id
         proposal.reviewed_at = datetime.now()
         proposal.review_notes = notes
@@ -150,11 +206,11 @@ class SchemaProposalSystem:
         Returns:
             True if rejected, False if not found
         """
-        if proposal_id not in self.proposals:
+        idx = self._active_index(proposal_id)
+        if idx is None:
             return False
         
-        proposal = self.proposals[proposal_id]
-        proposal.status = ProposalStatus.REJECTED
+        proposal = self._set_status(idx, ProposalStatus.REJECTED)
         proposal.reviewed_by = reviewer_id
         proposal.reviewed_at = datetime.now()
         proposal.rejection_reason = reason
@@ -172,18 +228,17 @@ class SchemaProposalSystem:
         Returns:
             True if implemented, False if not found or not approved
         """
-        if proposal_id not in self.proposals:
+        idx = self._active_index(proposal_id)
+        if idx is None:
             return False
         
-        proposal = self.proposals[proposal_id]
-        
-        if proposal.status != ProposalStatus.APPROVED:
+        if self._status_at(idx) != ProposalStatus.APPROVED:
             return False  # Can only implement approved proposals
         
         # TODO: Execute actual schema migration
         # This would update the graph schema, API definitions, etc.
         
-        proposal.status = ProposalStatus.IMPLEMENTED
+        proposal = self._set_status(idx, ProposalStatus.IMPLEMENTED)
         proposal.implemented_at = datetime.now()
         
         # Move to implemented proposals
@@ -194,11 +249,12 @@ class SchemaProposalSystem:
     
     def get_stats(self) -> Dict[str, int]:
         """Get proposal statistics"""
+        counts = self._status_counts()
         return {
-            "pending": len([p for p in self.proposals.values() if p.status == ProposalStatus.PENDING]),
-            "approved": len([p for p in self.proposals.values() if p.status == ProposalStatus.APPROVED]),
-            "rejected": len([p for p in self.proposals.values() if p.status == ProposalStatus.REJECTED]),
-            "implemented": len(self.implemented_proposals),
-            "total": len(self.proposals) + len(self.implemented_proposals)
+            "pending": counts[ProposalStatus.PENDING],
+            "approved": counts[ProposalStatus.APPROVED],
+            "rejected": counts[ProposalStatus.REJECTED],
+            "implemented": counts[ProposalStatus.IMPLEMENTED],
+            "total": len(self._proposal_list)
         }
 
@@ -0,0 +1,108 @@
+"""
+Tests for the ABC compilation engine
+"""
+
+import asyncio
+import atexit
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+from nemesis.compilation_engine import ABCCompilationEngine
+from nemesis.ai_ontology.behavioral_signature import BehavioralSignature, BehavioralTrait
+from nemesis.ai_ontology.predictive_modeling import ThreatForecast
+
+
+class TestCompileIntelligenceAsync(unittest.TestCase):
+    """Test async compilation against the synchronous pipeline"""
+    
+    def setUp(self):
+        self.engine = ABCCompilationEngine()
+        self.signature = BehavioralSignature(
+            actor_id="LAZARUS_GROUP",
+            signature_id="sig_1",
+            traits={trait: 0.5 for trait in BehavioralTrait},
+            confidence=0.8,
+            pattern_matches=[],
+            predicted_actions=[],
+            generated_at=datetime(2025, 1, 1),
+            model_version="test"
+        )
+        self.forecast = ThreatForecast(
+            actor_id="LAZARUS_GROUP",
+            forecast_id="forecast_1",
+            generated_at=datetime(2025, 1, 1),
+            predictions=[],
+            overall_risk_score=0.7
+        )
+        
+        # Hades and the AI layer have no data dependency, so async compilation
+        # must run them concurrently; each waits until both have started
+        self.started = threading.Barrier(2, timeout=5)
+        
+        def generate_signature(**kwargs):
+            self.started.wait()
+            return self.signature
+        
+        def process_intelligence_feed(raw_intelligence, transaction_data):
+            self.started.wait()
+            return {"entities": []}
+        
+        self.engine.hades = mock.Mock(generate_signature=mock.Mock(side_effect=generate_signature))
+        self.engine.ai_layer = mock.Mock(process_intelligence_feed=mock.Mock(side_effect=process_intelligence_feed))
+        self.engine.echo = mock.Mock(infer_relationships=mock.Mock(return_value=[]))
+        self.engine.predictive_model = mock.Mock(forecast_threat=mock.Mock(return_value=self.forecast))
+        self.inputs = {
+            "actor_id": "LAZARUS_GROUP",
+            "actor_name": "Lazarus Group",
+            "raw_intelligence": [{"text": "Lazarus Group moved funds", "source": "chainalysis"}],
+            "transaction_data": [{"amount": 1.0, "timestamp": 1700000000}]
+        }
+    
+    def test_matches_sync_compilation(self):
+        """Async compilation produces the same package as compile_intelligence"""
+        compiled = asyncio.run(self.engine.compile_intelligence_async(**self.inputs))
+        
+        self.engine.hades.generate_signature.side_effect = None
+        self.engine.hades.generate_signature.return_value = self.signature
+        self.engine.ai_layer.process_intelligence_feed.side_effect = None
+        self.engine.ai_layer.process_intelligence_feed.return_value = {"entities": []}
+        expected = self.engine.compile_intelligence(**self.inputs)
+        
+        self.assertEqual(compiled.confidence_score, expected.confidence_score)
+        self.assertEqual(compiled.coordination_network, expected.coordination_network)
+        self.assertEqual(compiled.sources, ["chainalysis"])
+        for key in ("targeting_instructions", "risk_assessment", "behavioral_traits"):
+            self.assertEqual(compiled.targeting_package[key], expected.targeting_package[key])
+        
+        receipt = compiled.targeting_package["receipt"]
+        package_hash = self.engine.receipt_generator._hash_intelligence_package(
+            compiled.to_receipt_payload(), receipt["hash_algo"]
+        )
+        self.assertEqual(receipt["intelligence_hash"], package_hash)
+    
+    def test_forecast_consumes_coordination_network(self):
+        """Nemesis runs after Echo, on the coordination network it built"""
+        compiled = asyncio.run(self.engine.compile_intelligence_async(**self.inputs, generate_receipt=False))
+        
+        forecast_kwargs = self.engine.predictive_model.forecast_threat.call_args.kwargs
+        self.assertEqual(forecast_kwargs["network_data"], compiled.coordination_network)
+        self.assertNotIn("receipt", compiled.targeting_package)
+    
+    def test_close_shuts_down_workers(self):
+        """close() stops the worker threads and releases the atexit hook"""
+        asyncio.run(self.engine.compile_intelligence_async(**self.inputs, generate_receipt=False))
+        executor = self.engine._get_executor()
+        
+        with mock.patch("atexit.unregister", wraps=atexit.unregister) as unregister:
+            with self.engine:
+                pass
+            self.engine.close()
+        
+        unregister.assert_called_once_with(executor.shutdown)
+        self.assertTrue(executor._shutdown)
+        self.assertIsNone(self.engine._executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
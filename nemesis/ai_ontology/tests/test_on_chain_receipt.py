@@ -0,0 +1,122 @@
+"""
+Tests for on-chain cryptographic receipts
+"""
+
+import hashlib
+import unittest
+from dataclasses import asdict, replace
+from unittest import mock
+from nemesis.on_chain_receipt import receipt_generator
+from nemesis.on_chain_receipt.receipt_generator import CryptographicReceiptGenerator
+from nemesis.on_chain_receipt.receipt_verifier import ReceiptVerifier
+from nemesis.on_chain_receipt.bitcoin_integration import BitcoinOnChainIntegration
+from nemesis.on_chain_receipt.merkle_tree import MerkleTree
+
+
+PACKAGE = {"actor_id": "LAZARUS_GROUP", "risk_score": 0.92, "targets": ["bridge", "mixer"]}
+
+
+class TestReceiptHashAlgorithms(unittest.TestCase):
+    """Test verifying receipts across intelligence hash algorithms"""
+    
+    def setUp(self):
+        self.verifier = ReceiptVerifier()
+    
+    def test_cross_algorithm_verification(self):
+        """Verifiers follow each receipt's hash_algo, not their own default"""
+        for issuer_algo, verifier_algo in (("sha256", "blake2b"), ("blake2b", "sha256")):
+            issuer = CryptographicReceiptGenerator(hash_algo=issuer_algo)
+            receipt = issuer.generate_receipt(PACKAGE, actor_id="LAZARUS_GROUP")
+            self.assertEqual(receipt.hash_algo, issuer_algo)
+            
+            self.assertTrue(CryptographicReceiptGenerator(hash_algo=verifier_algo).verify_receipt(receipt, PACKAGE))
+            self.verifier.receipt_generator = CryptographicReceiptGenerator(hash_algo=verifier_algo)
+            result = self.verifier.verify_intelligence_package(PACKAGE, asdict(receipt))
+            self.assertTrue(result["verified"])
+            
+            tampered = dict(PACKAGE, risk_score=0.1)
+            self.assertFalse(self.verifier.verify_intelligence_package(tampered, asdict(receipt))["verified"])
+    
+    def test_legacy_receipt_defaults_to_sha256(self):
+        """Receipts without hash_algo are verified as SHA-256"""
+        receipt = asdict(CryptographicReceiptGenerator(hash_algo="sha256").generate_receipt(PACKAGE))
+        del receipt["hash_algo"]
+        
+        self.verifier.receipt_generator = CryptographicReceiptGenerator(hash_algo="blake2b")
+        self.assertTrue(self.verifier.verify_intelligence_package(PACKAGE, receipt)["verified"])
+    
+    def test_unavailable_algorithm_reports_failure(self):
+        """A blake3 receipt on a host without blake3 fails verification instead of raising"""
+        receipt = CryptographicReceiptGenerator(hash_algo="sha256").generate_receipt(PACKAGE)
+        receipt = replace(receipt, hash_algo="blake3")
+        
+        with mock.patch.object(receipt_generator, "blake3", None):
+            result = self.verifier.verify_receipt(asdict(receipt), PACKAGE, verify_on_chain=False)
+            self.assertFalse(result["checks"]["hash_integrity"])
+            self.assertFalse(result["verified"])
+            self.assertIn("blake3", result["hash_integrity_error"])
+            
+            package_result = self.verifier.verify_intelligence_package(PACKAGE, asdict(receipt))
+            self.assertFalse(package_result["verified"])
+            self.assertIn("error", package_result)
+            
+            self.assertFalse(CryptographicReceiptGenerator(hash_algo="sha256").verify_receipt(receipt, PACKAGE))
+
+
+class TestBatchSubmission(unittest.TestCase):
+    """Test batched Bitcoin receipt submission"""
+    
+    def setUp(self):
+        self.bitcoin = BitcoinOnChainIntegration()
+        generator = CryptographicReceiptGenerator(hash_algo="sha256")
+        self.receipts = [
+            asdict(generator.generate_receipt(
+                dict(PACKAGE, sequence=i), actor_id=f"ACTOR_{i}", threat_level="high", package_type="dossier"
+            ))
+            for i in range(5)
+        ]
+    
+    def test_submit_receipts_batch(self):
+        """Batch submission returns one result per receipt, in order"""
+        results = self.bitcoin.submit_receipts_batch(self.receipts, fee_rate=5)
+        
+        self.assertEqual([r["receipt_id"] for r in results], [r["receipt_id"] for r in self.receipts])
+        self.assertTrue(all(r["status"] == "submitted" and len(r["tx_hash"]) == 64 for r in results))
+        self.assertEqual(self.bitcoin.submit_receipts_batch([]), [])
+    
+    def test_batch_payloads_match_single_submission(self):
+        """Each batched transaction commits to the receipt's own OP_RETURN payload"""
+        create_transaction = self.bitcoin._create_op_return_transaction
+        with mock.patch.object(self.bitcoin, "_create_op_return_transaction", wraps=create_transaction) as create:
+            self.bitcoin.submit_receipts_batch(self.receipts)
+        
+        payloads = [call.args[0] for call in create.call_args_list]
+        self.assertEqual(payloads, [self.bitcoin._prepare_op_return_data(r) for r in self.receipts])
+    
+    def test_merkle_proofs_round_trip(self):
+        """Every receipt's Merkle proof verifies against the committed root"""
+        result = self.bitcoin.submit_merkle_batch(self.receipts)
+        self.assertEqual(result["receipt_count"], len(self.receipts))
+        
+        verifier = MerkleTree([])
+        for i, receipt in enumerate(self.receipts):
+            proof = receipt["merkle_proof"]
+            self.assertEqual(proof["receipt_index"], i)
+            self.assertEqual(proof["root_hash"], result["merkle_root"])
+            
+            payload = self.bitcoin._prepare_op_return_data(receipt)
+            leaf_hash = hashlib.sha256(payload).hexdigest()
+            self.assertEqual(proof["receipt_hash"], leaf_hash)
+            self.assertTrue(verifier.verify_proof(leaf_hash, result["merkle_root"], proof["proof_path"]))
+            
+            forged = hashlib.sha256(payload + b"x").hexdigest()
+            self.assertFalse(verifier.verify_proof(forged, result["merkle_root"], proof["proof_path"]))
+    
+    def test_merkle_batch_requires_receipts(self):
+        """An empty Merkle batch is rejected"""
+        with self.assertRaises(ValueError):
+            self.bitcoin.submit_merkle_batch([])
+
+
+if __name__ == '__main__':
+    unittest.main()
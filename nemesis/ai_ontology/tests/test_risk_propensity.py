@@ -0,0 +1,54 @@
+"""
+Tests for the risk propensity model
+"""
+
+import unittest
+from nemesis.ai_ontology.risk_propensity import RiskPropensityModel
+
+
+class TestScoreBatch(unittest.TestCase):
+    """Test vectorized batch scoring"""
+    
+    def setUp(self):
+        self.model = RiskPropensityModel()
+        self.signatures = [
+            {"traits": {"chain_switching_frequency": 0.9}, "risk_score": 0.8},
+            {"traits": {}},
+            {"traits": {"chain_switching_frequency": 0.2}}
+        ]
+        self.histories = [
+            [{"type": "mixer_usage", "amount": 100, "timestamp": 1700000000 + i * 60} for i in range(12)]
+            + [{"type": "bridge_transfer", "amount": 5000, "timestamp": 1700100000}],
+            [],
+            [
+                {"type": "transfer", "amount": 10, "timestamp": 1700000000},
+                {"type": "transfer", "amount": 10, "timestamp": 1700003600}
+            ]
+        ]
+        self.networks = [{"coordination_score": 0.8, "partners": ["partner_1"]}, None, {}]
+    
+    def test_matches_per_actor_assessment(self):
+        """Batch scores equal assess_risk_propensity for each actor"""
+        scores = self.model.score_batch(self.signatures, self.histories, self.networks)
+        
+        for i, (signature, history, network) in enumerate(zip(self.signatures, self.histories, self.networks)):
+            assessment = self.model.assess_risk_propensity(f"actor_{i}", signature, history, network)
+            self.assertAlmostEqual(scores["mobilization_index"][i], assessment.mobilization_index)
+            self.assertAlmostEqual(scores["volatility_score"][i], assessment.volatility_score)
+            self.assertAlmostEqual(scores["overall_risk_score"][i], assessment.overall_risk_score)
+    
+    def test_network_data_optional(self):
+        """Omitted network data scores like explicit None per actor"""
+        scores = self.model.score_batch(self.signatures, self.histories)
+        self.assertEqual(len(scores["overall_risk_score"]), len(self.signatures))
+    
+    def test_mismatched_lengths_rejected(self):
+        """Inputs of different lengths raise instead of dropping actors"""
+        with self.assertRaises(ValueError):
+            self.model.score_batch(self.signatures, self.histories[:2])
+        with self.assertRaises(ValueError):
+            self.model.score_batch(self.signatures, self.histories, self.networks[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for human-gated schema proposals
+"""
+
+import unittest
+from nemesis.ai_ontology.schema_proposals import SchemaProposalSystem, ProposalStatus
+
+
+class TestProposalStatusTracking(unittest.TestCase):
+    """Test the array-backed proposal status"""
+    
+    def setUp(self):
+        self.system = SchemaProposalSystem()
+    
+    def _propose(self, count: int):
+        return [
+            self.system.propose_schema_change(
+                proposal_type="new_entity_type",
+                description=f"Proposal {i}",
+                proposed_schema={"type": f"entity_{i}"},
+                evidence=["observed in reports"],
+                confidence=0.8
+            )
+            for i in range(count)
+        ]
+    
+    def test_lifecycle_past_growth(self):
+        """Scans, stats and the proposals dict agree once the status array has grown"""
+        proposals = self._propose(200)
+        for proposal in proposals[:50]:
+            self.assertTrue(self.system.approve_proposal(proposal.proposal_id, "reviewer"))
+        for proposal in proposals[50:80]:
+            self.assertTrue(self.system.reject_proposal(proposal.proposal_id, "reviewer", "duplicate"))
+        for proposal in proposals[:20]:
+            self.assertTrue(self.system.implement_proposal(proposal.proposal_id))
+        
+        self.assertEqual(self.system.get_stats(), {
+            "pending": 120, "approved": 30, "rejected": 30, "implemented": 20, "total": 200
+        })
+        self.assertEqual(self.system.get_pending_proposals(), proposals[80:])
+        self.assertEqual(len(self.system.proposals), 180)
+        self.assertNotIn(proposals[0].proposal_id, self.system.proposals)
+        self.assertIs(self.system.get_proposal(proposals[0].proposal_id), proposals[0])
+        self.assertEqual(proposals[0].status, ProposalStatus.IMPLEMENTED)
+        self.assertEqual(proposals[60].status, ProposalStatus.REJECTED)
+    
+    def test_only_approved_proposals_implement(self):
+        """Pending, rejected and already-implemented proposals cannot be implemented"""
+        pending, rejected, approved = self._propose(3)
+        self.system.reject_proposal(rejected.proposal_id, "reviewer", "unsafe")
+        self.system.approve_proposal(approved.proposal_id, "reviewer")
+        
+        self.assertFalse(self.system.implement_proposal(pending.proposal_id))
+        self.assertFalse(self.system.implement_proposal(rejected.proposal_id))
+        self.assertTrue(self.system.implement_proposal(approved.proposal_id))
+        self.assertFalse(self.system.implement_proposal(approved.proposal_id))
+        self.assertFalse(self.system.approve_proposal(approved.proposal_id, "reviewer"))
+    
+    def test_proposals_is_a_dict(self):
+        """proposals stays a plain dict of not-yet-implemented proposals"""
+        proposal, = self._propose(1)
+        self.assertIs(self.system.proposals, self.system.proposals)
+        self.assertEqual(self.system.proposals, {proposal.proposal_id: proposal})
+
+
+if __name__ == '__main__':
+    unittest.main()
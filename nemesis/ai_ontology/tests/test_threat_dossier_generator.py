@@ -0,0 +1,111 @@
+"""
+Tests for threat dossier generation
+"""
+
+import unittest
+from dataclasses import asdict
+from unittest import mock
+from nemesis.ai_ontology import threat_dossier_generator
+from nemesis.ai_ontology.threat_dossier_generator import ThreatDossierGenerator
+
+
+def _spec(actor_id: str, risk: float = 0.4) -> dict:
+    """generate_dossier keyword arguments for a small synthetic actor"""
+    return {
+        "actor_id": actor_id,
+        "actor_name": f"Actor {actor_id}",
+        "behavioral_signature": {"risk_score": 0.6, "traits": {}},
+        "network_data": {"partners": ["partner_1"], "facilitator_count": 1},
+        "threat_forecast": {"overall_risk_score": risk, "predictions": []},
+        "transaction_history": [
+            {"timestamp": "2024-01-01T00:00:00", "amount": 10.0},
+            {"timestamp": "2024-02-01T00:00:00", "amount": 20.0}
+        ]
+    }
+
+
+class TestDossierCache(unittest.TestCase):
+    """Test the keyed dossier TTL cache"""
+    
+    def setUp(self):
+        self.generator = ThreatDossierGenerator()
+    
+    def test_cache_requires_key(self):
+        """Dossiers generated without a cache_key are never cached"""
+        self.generator.generate_dossier(**_spec("A"))
+        self.assertEqual(len(self.generator._dossier_cache), 0)
+    
+    def test_hits_do_not_share_containers(self):
+        """Mutating a returned dossier does not leak into later hits"""
+        first = self.generator.generate_dossier(**_spec("A"), cache_key="A:v1")
+        first.risk_scores["injected"] = 1.0
+        
+        second = self.generator.generate_dossier(**_spec("A"), cache_key="A:v1")
+        second.attack_history.append({"injected": True})
+        third = self.generator.generate_dossier(**_spec("A"), cache_key="A:v1")
+        
+        self.assertNotIn("injected", third.risk_scores)
+        self.assertNotIn({"injected": True}, third.attack_history)
+    
+    def test_eviction_is_lru(self):
+        """A recently hit entry survives eviction over an older one"""
+        with mock.patch.object(threat_dossier_generator, "_DOSSIER_CACHE_MAXSIZE", 2):
+            self.generator.generate_dossier(**_spec("A"), cache_key="A")
+            self.generator.generate_dossier(**_spec("B"), cache_key="B")
+            self.generator.generate_dossier(**_spec("A"), cache_key="A")
+            self.generator.generate_dossier(**_spec("C"), cache_key="C")
+        
+        self.assertEqual(list(self.generator._dossier_cache), ["A", "C"])
+
+
+class TestOptionalInputs(unittest.TestCase):
+    """Test inputs that arrive as explicit None"""
+    
+    def setUp(self):
+        self.generator = ThreatDossierGenerator()
+    
+    def test_null_countermeasures(self):
+        """A null recommended_countermeasures list yields no countermeasures"""
+        spec = _spec("A")
+        spec["threat_forecast"]["recommended_countermeasures"] = None
+        self.assertEqual(self.generator.generate_dossier(**spec).recommended_countermeasures, ())
+    
+    def test_null_pattern_matches(self):
+        """A null pattern_matches list yields no pattern matches"""
+        spec = _spec("A")
+        spec["behavioral_signature"]["pattern_matches"] = None
+        self.assertEqual(self.generator.generate_dossier(**spec).pattern_matches, ())
+
+
+class TestGenerateDossiersBatch(unittest.TestCase):
+    """Test batch dossier generation"""
+    
+    def setUp(self):
+        self.generator = ThreatDossierGenerator()
+        self.specs = [_spec(f"ACTOR_{i}", risk=i / 10) for i in range(6)]
+    
+    def _comparable(self, dossier):
+        """Dossier fields that do not depend on the generation clock"""
+        fields = asdict(dossier)
+        del fields["generated_at"]
+        return fields
+    
+    def test_in_process_matches_single(self):
+        """Small batches match generate_dossier, in input order"""
+        dossiers = self.generator.generate_dossiers_batch(self.specs)
+        
+        self.assertEqual([d.actor_id for d in dossiers], [spec["actor_id"] for spec in self.specs])
+        for spec, dossier in zip(self.specs, dossiers):
+            self.assertEqual(self._comparable(dossier), self._comparable(self.generator.generate_dossier(**spec)))
+    
+    def test_process_pool_matches_in_process(self):
+        """Fanning out across worker processes gives the same dossiers"""
+        with mock.patch.object(threat_dossier_generator, "_PROCESS_POOL_MIN_DOSSIERS", 1):
+            pooled = self.generator.generate_dossiers_batch(self.specs, workers=2)
+        local = self.generator.generate_dossiers_batch(self.specs, workers=1)
+        
+        self.assertEqual([self._comparable(d) for d in pooled], [self._comparable(d) for d in local])
+
+
+if __name__ == '__main__':
+    unittest.main()
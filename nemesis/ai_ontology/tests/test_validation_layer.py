@@ -0,0 +1,62 @@
+"""
+Tests for the validation layer
+"""
+
+import unittest
+from unittest import mock
+from nemesis.ai_ontology import validation_layer
+from nemesis.ai_ontology.validation_layer import ValidationLayer
+
+
+def _wallet(address, confidence: float = 0.9) -> dict:
+    """validate_entity arguments for a wallet actor"""
+    return {
+        "entity_type": "actor",
+        "entity_data": {"actor_id": "WALLET", "name": "Wallet", "type": "wallet", "address": address},
+        "confidence": confidence,
+        "source_id": "report_1"
+    }
+
+
+class TestValidateBatch(unittest.TestCase):
+    """Test batch entity validation"""
+    
+    def setUp(self):
+        self.validator = ValidationLayer()
+        self.entities = [
+            _wallet("0x" + "ab" * 20),
+            _wallet("0x1234"),
+            _wallet("1BoatSLRHtKNngkdXEeobR76b53LETtpyT"),
+            _wallet("0x" + "ab" * 20 + "\n0x" + "cd" * 20),
+            _wallet("0x" + "ab" * 20, confidence=0.5),
+            {"entity_type": "event", "entity_data": {"event_id": "E1"}, "confidence": 0.9, "source_id": "r"},
+            {"entity_type": "vehicle", "entity_data": {}, "confidence": 0.9, "source_id": "r"},
+            {"entity_type": "actor", "entity_data": "not a dict", "confidence": 0.9, "source_id": "r"}
+        ]
+    
+    def _assert_matches_single(self):
+        results = self.validator.validate_batch(self.entities)
+        self.assertEqual(len(results), len(self.entities))
+        for entity, result in zip(self.entities, results):
+            self.assertEqual(result, self.validator.validate_entity(**entity))
+    
+    def test_matches_validate_entity(self):
+        """Each batch result equals validating the entity on its own"""
+        self._assert_matches_single()
+        self.assertEqual(
+            [r.is_valid for r in self.validator.validate_batch(self.entities)[:4]],
+            [True, False, True, False]
+        )
+    
+    def test_matches_without_hyperscan(self):
+        """The regex fallback gives the same results"""
+        with mock.patch.object(validation_layer, "hyperscan", None):
+            self._assert_matches_single()
+    
+    def test_empty_batch(self):
+        """An empty batch validates to no results"""
+        self.assertEqual(self.validator.validate_batch([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,12 +3,43 @@ Validation Layer - Sanity checks before graph insertion
 Validates wallet existence, schema compliance, confidence thresholds
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
 import re
 
+try:
+    import hyperscan
+except ImportError:
+    # Optional dependency: batch validation falls back to the compiled regexes
+    hyperscan = None
 
-@dataclass
+
+# Address and timestamp formats, compiled once for the validation hot path
+_ETH_RE = re.compile(r'^0x[a-fA-F0-9]{40}$')
+_BTC_RE = re.compile(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$')
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Lazily compiled Hyperscan database for batch wallet validation
+_wallet_hs_db = None
+
+
+def _get_wallet_hs_db():
+    """Compile the wallet patterns into a multiline Hyperscan database once"""
+    global _wallet_hs_db
+    if _wallet_hs_db is None:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[_ETH_RE.pattern.encode('ascii'), _BTC_RE.pattern.encode('ascii')],
+            ids=[0, 1],
+            elements=2,
+            flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST] * 2
+        )
+        _wallet_hs_db = db
+    return _wallet_hs_db
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of entity validation"""
     is_valid: bool
@@ -23,6 +54,16 @@ class ValidationLayer:
     Prevents bad data from entering the graph
     """
     
+    # Required schema fields per entity type, in reporting order
+    _REQUIRED_FIELD_ORDER = {
+        "actor": ("actor_id", "name", "type"),
+        "event": ("event_id", "event_type", "timestamp"),
+        "pattern": ("pattern_id", "category", "description"),
+    }
+    _REQUIRED_FIELDS = {
+        entity_type: frozenset(fields) for entity_type, fields in _REQUIRED_FIELD_ORDER.items()
+    }
+    
     def __init__(self):
         self.confidence_threshold_high = 0.95  # Auto-insert threshold
         self.confidence_threshold_medium = 0.80  # Human review threshold
@@ -47,6 +88,77 @@ class ValidationLayer:
         Returns:
             ValidationResult with validation status and errors
         """
+        return self._validate_entity(
+            entity_type, entity_data, confidence, self._is_valid_wallet_address
+        )
+    
+    def validate_batch(self, entities: List[Dict[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate many entities, checking all wallet addresses in one scan
+        
+        Args:
+            entities: Dicts with entity_type, entity_data, confidence and
+                source_id keys (the validate_entity arguments)
+        
+        Returns:
+            ValidationResult per entity, in input order
+        """
+        addresses = [
+            entity["entity_data"].get("address") for entity in entities
+            if isinstance(entity.get("entity_data"), dict)
+        ]
+        valid_addresses = self._validate_addresses_batch(addresses)
+        
+        def is_valid_address(address: str) -> bool:
+            valid = valid_addresses.get(address)
+            return self._is_valid_wallet_address(address) if valid is None else valid
+        
+        return [
+            self._validate_entity(
+                entity["entity_type"], entity["entity_data"], entity["confidence"], is_valid_address
+            )
+            for entity in entities
+        ]
+    
+    def _validate_addresses_batch(self, addresses: List[Any]) -> Dict[str, bool]:
+        """
+        Wallet format validity for each distinct address
+        
+        With Hyperscan available, addresses are newline-joined into one buffer
+        and scanned once; a match spanning exactly one line marks it valid.
+        """
+        unique = list(dict.fromkeys(
+            address for address in addresses
+            if isinstance(address, str) and address and "\n" not in address
+        ))
+        if hyperscan is None or not unique:
+            return {address: self._is_valid_wallet_address(address) for address in unique}
+        
+        encoded = [address.encode('utf-8') for address in unique]
+        spans = {}
+        offset = 0
+        for address, raw in zip(unique, encoded):
+            spans[(offset, offset + len(raw))] = address
+            offset += len(raw) + 1
+        
+        valid = dict.fromkeys(unique, False)
+        
+        def on_match(pattern_id, start, end, flags, context):
+            address = spans.get((start, end))
+            if address is not None:
+                valid[address] = True
+        
+        _get_wallet_hs_db().scan(b"\n".join(encoded), match_event_handler=on_match)
+        return valid
+    
+    def _validate_entity(
+        self,
+        entity_type: str,
+        entity_data: Dict[str, Any],
+        confidence: float,
+        is_valid_address: Callable[[str], bool]
+    ) -> ValidationResult:
+        """Shared body of validate_entity and validate_batch"""
         errors = []
         warnings = []
         
@@ -54,25 +166,30 @@ class ValidationLayer:
         if confidence < self.confidence_threshold_low:
             errors.append(f"Confidence {confidence:.2f} below minimum threshold {self.confidence_threshold_low}")
         
-        # Entity type-specific validation
-        if entity_type == "actor":
-            result = self._validate_actor(entity_data, errors, warnings)
-        elif entity_type == "event":
-            result = self._validate_event(entity_data, errors, warnings)
-        elif entity_type == "pattern":
-            result = self._validate_pattern(entity_data, errors, warnings)
-        else:
-            errors.append(f"Unknown entity type: {entity_type}")
-            result = ValidationResult(is_valid=False, errors=errors, warnings=warnings)
-        
-        # Schema validation
+        # Schema validation runs first and owns the required-field checks;
+        # if it fails, the type-specific checks below have nothing to inspect
         schema_errors = self._validate_schema(entity_type, entity_data)
         errors.extend(schema_errors)
         
-        # On-chain validation for wallets
-        if entity_type == "actor" and entity_data.get("type") == "wallet":
-            wallet_errors = self._validate_wallet_exists(entity_data)
-            errors.extend(wallet_errors)
+        # Entity type-specific validation
+        if entity_type not in self._REQUIRED_FIELDS:
+            errors.append(f"Unknown entity type: {entity_type}")
+        elif not schema_errors:
+            if entity_type == "actor":
+                self._validate_actor(entity_data, errors, warnings)
+                
+                # Wallet address format is checked exactly once, here; only
+                # well-formed addresses go on to the on-chain check
+                if entity_data.get("type") == "wallet" and "address" in entity_data:
+                    address = entity_data["address"]
+                    if not is_valid_address(address):
+                        errors.append(f"Invalid wallet address format: {address}")
+                    elif address:
+                        self._validate_wallet_exists(address, errors)
+            elif entity_type == "event":
+                self._validate_event(entity_data, errors, warnings)
+            else:
+                self._validate_pattern(entity_data, errors, warnings)
         
         is_valid = len(errors) == 0
         
@@ -84,26 +201,12 @@ class ValidationLayer:
         )
     
     def _validate_actor(self, entity_data: Dict[str, Any], errors: List[str], warnings: List[str]) -> ValidationResult:
-        """Validate actor entity"""
-        # Required fields
-        if "actor_id" not in entity_data:
-            errors.append("Missing required field: actor_id")
-        if "name" not in entity_data:
-            errors.append("Missing required field: name")
-        if "type" not in entity_data:
-            errors.append("Missing required field: type")
-        
+        """Validate actor entity (required fields are checked by _validate_schema)"""
         # Type validation
         valid_types = ["wallet", "individual", "organization", "nation_state", "service_provider"]
         if "type" in entity_data and entity_data["type"] not in valid_types:
             errors.append(f"Invalid actor type: {entity_data['type']}. Must be one of {valid_types}")
         
-        # Wallet address validation
-        if entity_data.get("type") == "wallet" and "address" in entity_data:
-            address = entity_data["address"]
-            if not self._is_valid_wallet_address(address):
-                errors.append(f"Invalid wallet address format: {address}")
-        
         # Risk score validation
         if "risk_score" in entity_data:
             risk_score = entity_data["risk_score"]
@@ -113,15 +216,7 @@ class ValidationLayer:
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
     
     def _validate_event(self, entity_data: Dict[str, Any], errors: List[str], warnings: List[str]) -> ValidationResult:
-        """Validate event entity"""
-        # Required fields
-        if "event_id" not in entity_data:
-            errors.append("Missing required field: event_id")
-        if "event_type" not in entity_data:
-            errors.append("Missing required field: event_type")
-        if "timestamp" not in entity_data:
-            errors.append("Missing required field: timestamp")
-        
+        """Validate event entity (required fields are checked by _validate_schema)"""
         # Timestamp validation
         if "timestamp" in entity_data:
             timestamp = entity_data["timestamp"]
@@ -131,15 +226,8 @@ class ValidationLayer:
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
     
     def _validate_pattern(self, entity_data: Dict[str, Any], errors: List[str], warnings: List[str]) -> ValidationResult:
-        """Validate pattern entity"""
-        # Required fields
-        if "pattern_id" not in entity_data:
-            errors.append("Missing required field: pattern_id")
-        if "category" not in entity_data:
-            errors.append("Missing required field: category")
-        if "description" not in entity_data:
-            errors.append("Missing required field: description")
-        
+        """Validate pattern entity (required fields are checked by _validate_schema)"""
+        # No pattern-specific checks beyond the required fields yet
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
     
     def _validate_schema(self, entity_type: str, entity_data: Dict[str, Any]) -> List[str]:
@@ -152,53 +240,37 @@ class ValidationLayer:
             return errors
         
         # Type-specific schema checks
-        if entity_type == "actor":
-            required = ["actor_id", "name", "type"]
-        elif entity_type == "event":
-            required = ["event_id", "event_type", "timestamp"]
-        elif entity_type == "pattern":
-            required = ["pattern_id", "category", "description"]
-        else:
+        required = self._REQUIRED_FIELDS.get(entity_type)
+        if required is None:
             return errors
         
-        for field in required:
-            if field not in entity_data:
-                errors.append(f"Missing required schema field: {field}")
+        # Set difference against the key view; report in schema order
+        missing = required - entity_data.keys()
+        if missing:
+            errors.extend(
+                f"Missing required field: {field}"
+                for field in self._REQUIRED_FIELD_ORDER[entity_type] if field in missing
+            )
         
         return errors
     
-    def _validate_wallet_exists(self, entity_data: Dict[str, Any]) -> List[str]:
+    def _validate_wallet_exists(self, address: str, errors: List[str]) -> None:
         """
-        Validate wallet exists on-chain
+        Validate a well-formed wallet address exists on-chain
         TODO: Implement actual on-chain check via RPC call
         """
-        errors = []
-        address = entity_data.get("address")
-        
-        if not address:
-            return errors
-        
-        # Basic format validation (actual existence check would require RPC)
-        if not self._is_valid_wallet_address(address):
-            errors.append(f"Invalid wallet address format: {address}")
-        
+        # Format is already validated by the caller; this stage is RPC only
         # TODO: Add actual on-chain existence check
         # Example: Check if address has any transactions or balance > 0
-        
-        return errors
     
     def _is_valid_wallet_address(self, address: str) -> bool:
         """Check if wallet address has valid format"""
-        # Ethereum address format
-        if re.match(r'^0x[a-fA-F0-9]{40}$', address):
-            return True
-        
-        # Bitcoin address format (basic check)
-        if re.match(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$', address):
-            return True
-        
+        # The prefix decides which format can apply, so only one pattern runs:
+        # Ethereum (0x + 40 hex chars) or Bitcoin (basic check)
         # Add other chain formats as needed
-        return False
+        if address.startswith('0x'):
+            return _ETH_RE.match(address) is not None
+        return _BTC_RE.match(address) is not None
     
     def _is_valid_timestamp(self, timestamp: Any) -> bool:
         """Check if timestamp is valid format"""
@@ -206,12 +278,8 @@ class ValidationLayer:
             return True  # Unix timestamp
         
         if isinstance(timestamp, str):
-            # ISO format
-            if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', timestamp):
-                return True
-            # Date format
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', timestamp):
-                return True
+            # ISO format, then date format
+            return bool(_ISO_RE.match(timestamp) or _DATE_RE.match(timestamp))
         
         return False
     
@@ -5,21 +5,47 @@ Orchestrates Hades → Echo → Nemesis pipeline to compile intelligence in <500
 Copyright (c) 2025 GH Systems. All rights reserved.
 """
 
+import asyncio
+import atexit
+import heapq
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 
 # Import AI ontology components
 from nemesis.ai_ontology.integration_layer import ABCIntegrationLayer
-from nemesis.ai_ontology.behavioral_signature import AIHadesProfiler, BehavioralSignature
+from nemesis.ai_ontology.behavioral_signature import AIHadesProfiler, BehavioralSignature, BehavioralTrait
 from nemesis.ai_ontology.relationship_inference import RelationshipInferenceEngine, InferredRelationship
-from nemesis.ai_ontology.predictive_modeling import PredictiveThreatModel, ThreatForecast
+from nemesis.ai_ontology.predictive_modeling import PredictiveThreatModel, ThreatForecast, ThreatActionType
 from nemesis.ai_ontology.threat_dossier_generator import ThreatDossierGenerator, ThreatDossier
 from nemesis.on_chain_receipt.receipt_generator import CryptographicReceiptGenerator, IntelligenceReceipt
 
 
-@dataclass
+# Below this many agencies, process-pool startup (each worker builds its own
+# engine) costs more than parallel compilation saves
+_PROCESS_POOL_MIN_AGENCIES = 8
+
+# Relationship types that place an entity among partners / facilitators
+_PARTNER_TYPES = frozenset({"coordinates_with", "partners_with"})
+_FACILITATOR_TYPES = frozenset({"facilitates", "enables"})
+
+# Enum member -> value, so targeting packages skip the Enum.value descriptor
+_TRAIT_VALUES = {trait: trait.value for trait in BehavioralTrait}
+_ACTION_VALUES = {action: action.value for action in ThreatActionType}
+
+# Prediction counts from which top-k selection uses a heap instead of a full sort
+_TOP_PREDICTIONS_HEAP_MIN = 256
+
+
+# Slotted for batch compilation workloads; fields are keyword-only, as every
+# construction site already passes them by name
+@dataclass(slots=True, kw_only=True)
 class CompiledIntelligence:
     """Complete compiled intelligence package"""
     compilation_id: str
@@ -42,6 +68,33 @@ class CompiledIntelligence:
     compilation_time_ms: float = 0.0
     confidence_score: float = 0.0
     sources: List[str] = field(default_factory=list)
+    
+    def to_receipt_payload(self) -> Dict[str, Any]:
+        """
+        Canonical, JSON-serializable projection of the package for receipt hashing
+        
+        Binds the compilation, the Hades signature and the Nemesis forecast by
+        id and score, plus every inferred relationship, without deep-copying
+        the nested dataclasses the way asdict() would.
+        """
+        return {
+            "compilation_id": self.compilation_id,
+            "actor_id": self.actor_id,
+            "compiled_at": self.compiled_at.isoformat(),
+            "confidence_score": self.confidence_score,
+            "behavioral_signature": {
+                "signature_id": self.behavioral_signature.signature_id,
+                "confidence": self.behavioral_signature.confidence
+            },
+            "relationships": sorted(
+                (rel.target_entity_id, rel.confidence) for rel in self.relationships
+            ),
+            "threat_forecast": {
+                "forecast_id": self.threat_forecast.forecast_id,
+                "overall_risk_score": self.threat_forecast.overall_risk_score
+            } if self.threat_forecast is not None else None,
+            "sources": self.sources
+        }
 
 
 class ABCCompilationEngine:
@@ -70,6 +123,10 @@ class ABCCompilationEngine:
         self.receipt_generator = CryptographicReceiptGenerator()
         
         self.engine_version = "1.0.0"
+        
+        # Worker threads for compile_intelligence_async (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
     
     def compile_intelligence(
         self,
@@ -95,7 +152,7 @@ class ABCCompilationEngine:
             CompiledIntelligence package ready for delivery
         """
         start_time = time.time()
-        compilation_id = f"abc_{actor_id}_{int(time.time())}"
+        compilation_id = f"abc_{actor_id}_{int(start_time)}"
         
         # Step 1: HADES - Behavioral Profiling
         # Compile raw telemetry into actor signatures & risk posture
@@ -132,12 +189,142 @@ class ABCCompilationEngine:
             transaction_history=transaction_data or []
         )
         
+        return self._finalize_compilation(
+            compilation_id=compilation_id,
+            actor_id=actor_id,
+            actor_name=actor_name,
+            raw_intelligence=raw_intelligence,
+            behavioral_signature=behavioral_signature,
+            coordination_network=coordination_network,
+            relationships=relationships,
+            threat_forecast=threat_forecast,
+            start_time=start_time,
+            generate_receipt=generate_receipt
+        )
+    
+    async def compile_intelligence_async(
+        self,
+        actor_id: str,
+        actor_name: str,
+        raw_intelligence: List[Dict[str, Any]],
+        transaction_data: Optional[List[Dict[str, Any]]] = None,
+        network_data: Optional[Dict[str, Any]] = None,
+        generate_receipt: bool = True
+    ) -> CompiledIntelligence:
+        """
+        Async variant of compile_intelligence for callers running an event loop
+        
+        Hades signature generation and AI-layer feed processing have no data
+        dependency on each other, so they run concurrently on the engine's
+        worker threads; Echo and Nemesis then run in order on their outputs.
+        The event loop is never blocked by a compilation stage.
+        
+        Args:
+            Same as compile_intelligence
+            
+        Returns:
+            CompiledIntelligence package ready for delivery
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        start_time = time.time()
+        compilation_id = f"abc_{actor_id}_{int(start_time)}"
+        
+        # Step 1: HADES profiling alongside AI-layer processing for ECHO
+        behavioral_signature, ai_output = await asyncio.gather(
+            loop.run_in_executor(executor, partial(
+                self.hades.generate_signature,
+                actor_id=actor_id,
+                transaction_history=transaction_data or [],
+                network_data=network_data,
+                intelligence_reports=[
+                    item.get("text", str(item)) for item in raw_intelligence if isinstance(item, dict)
+                ]
+            )),
+            loop.run_in_executor(
+                executor, self.ai_layer.process_intelligence_feed, raw_intelligence, transaction_data
+            )
+        )
+        
+        # Step 2: ECHO - needs both Step 1 outputs
+        relationships = await loop.run_in_executor(executor, self.echo.infer_relationships, {
+            "entities": ai_output.get("entities", []),
+            "behavioral_signatures": {actor_id: behavioral_signature}
+        })
+        coordination_network = self._build_coordination_network(relationships, network_data or {})
+        
+        # Step 3: NEMESIS - the forecast consumes the coordination network
+        threat_forecast = await loop.run_in_executor(executor, partial(
+            self.predictive_model.forecast_threat,
+            actor_id=actor_id,
+            behavioral_signature=behavioral_signature,
+            network_data=coordination_network,
+            transaction_history=transaction_data or []
+        ))
+        
+        return await loop.run_in_executor(executor, partial(
+            self._finalize_compilation,
+            compilation_id=compilation_id,
+            actor_id=actor_id,
+            actor_name=actor_name,
+            raw_intelligence=raw_intelligence,
+            behavioral_signature=behavioral_signature,
+            coordination_network=coordination_network,
+            relationships=relationships,
+            threat_forecast=threat_forecast,
+            start_time=start_time,
+            generate_receipt=generate_receipt
+        ))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker threads shared by async compilations on this engine"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    executor = ThreadPoolExecutor(max_workers=4)
+                    # Drop queued stages at interpreter exit instead of running them
+                    atexit.register(executor.shutdown, cancel_futures=True)
+                    self._executor = executor
+        return self._executor
+    
+    def close(self):
+        """Shut down the async compilation worker threads, if started"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            atexit.unregister(executor.shutdown)
+            executor.shutdown(cancel_futures=True)
+    
+    def __enter__(self) -> "ABCCompilationEngine":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _finalize_compilation(
+        self,
+        compilation_id: str,
+        actor_id: str,
+        actor_name: str,
+        raw_intelligence: List[Dict[str, Any]],
+        behavioral_signature: BehavioralSignature,
+        coordination_network: Dict[str, Any],
+        relationships: List[InferredRelationship],
+        threat_forecast: ThreatForecast,
+        start_time: float,
+        generate_receipt: bool
+    ) -> CompiledIntelligence:
+        """Build the targeting package, compiled intelligence and receipt"""
+        # One clock read stamps both the package and the targeting package
+        compiled_at = datetime.now()
+        
         # Generate targeting package
         targeting_package = self._generate_targeting_package(
             actor_id=actor_id,
             behavioral_signature=behavioral_signature,
             coordination_network=coordination_network,
-            threat_forecast=threat_forecast
+            threat_forecast=threat_forecast,
+            compiled_at=compiled_at
         )
         
         # Calculate compilation time
@@ -147,7 +334,8 @@ class ABCCompilationEngine:
         confidence_score = self._calculate_confidence(
             behavioral_signature,
             relationships,
-            threat_forecast
+            threat_forecast,
+            rel_confidence=coordination_network.get("network_confidence")
         )
         
         # Build compiled intelligence
@@ -155,7 +343,7 @@ class ABCCompilationEngine:
             compilation_id=compilation_id,
             actor_id=actor_id,
             actor_name=actor_name,
-            compiled_at=datetime.now(),
+            compiled_at=compiled_at,
             behavioral_signature=behavioral_signature,
             coordination_network=coordination_network,
             relationships=relationships,
@@ -169,7 +357,7 @@ class ABCCompilationEngine:
         # Generate cryptographic receipt if requested
         if generate_receipt:
             receipt = self.receipt_generator.generate_receipt(
-                intelligence_package=asdict(compiled),
+                intelligence_package=compiled.to_receipt_payload(),
                 actor_id=actor_id,
                 threat_level=self._determine_threat_level(confidence_score, threat_forecast),
                 package_type="targeting_package"
@@ -189,16 +377,17 @@ class ABCCompilationEngine:
         facilitators = []
         
         for rel in relationships:
-            if rel.relationship_type.value in ["coordinates_with", "partners_with"]:
+            rtype = rel.relationship_type.value
+            if rtype in _PARTNER_TYPES:
                 partners.append({
                     "entity_id": rel.target_entity_id,
-                    "relationship_type": rel.relationship_type.value,
+                    "relationship_type": rtype,
                     "confidence": rel.confidence
                 })
-            elif rel.relationship_type.value in ["facilitates", "enables"]:
+            elif rtype in _FACILITATOR_TYPES:
                 facilitators.append({
                     "entity_id": rel.target_entity_id,
-                    "relationship_type": rel.relationship_type.value,
+                    "relationship_type": rtype,
                     "confidence": rel.confidence
                 })
         
@@ -215,21 +404,23 @@ class ABCCompilationEngine:
         actor_id: str,
         behavioral_signature: BehavioralSignature,
         coordination_network: Dict[str, Any],
-        threat_forecast: ThreatForecast
+        threat_forecast: ThreatForecast,
+        compiled_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Generate executable targeting package"""
-        # Get top predicted actions
-        top_predictions = sorted(
-            threat_forecast.predictions,
-            key=lambda p: p.confidence,
-            reverse=True
-        )[:3]
+        # Get top predicted actions; nlargest keeps sorted()'s order (ties
+        # included) but only beats a full sort on long prediction lists
+        predictions = threat_forecast.predictions
+        if len(predictions) >= _TOP_PREDICTIONS_HEAP_MIN:
+            top_predictions = heapq.nlargest(3, predictions, key=attrgetter("confidence"))
+        else:
+            top_predictions = sorted(predictions, key=attrgetter("confidence"), reverse=True)[:3]
         
         return {
             "actor_id": actor_id,
             "targeting_instructions": [
                 {
-                    "action": pred.action_type.value,
+                    "action": _ACTION_VALUES[pred.action_type],
                     "description": pred.description,
                     "confidence": pred.confidence,
                     "timeframe": pred.estimated_timeframe,
@@ -250,21 +441,28 @@ class ABCCompilationEngine:
                 "facilitators": coordination_network.get("facilitators", [])
             },
             "behavioral_traits": {
-                trait.value: score
+                _TRAIT_VALUES[trait]: score
                 for trait, score in behavioral_signature.traits.items()
             },
-            "compiled_at": datetime.now().isoformat()
+            "compiled_at": (compiled_at or datetime.now()).isoformat()
         }
     
     def _calculate_confidence(
         self,
         behavioral_signature: BehavioralSignature,
         relationships: List[InferredRelationship],
-        threat_forecast: ThreatForecast
+        threat_forecast: ThreatForecast,
+        rel_confidence: Optional[float] = None
     ) -> float:
-        """Calculate overall confidence score"""
+        """
+        Calculate overall confidence score
+        
+        rel_confidence, when given, is the mean relationship confidence already
+        computed by _build_coordination_network (its network_confidence)
+        """
         sig_confidence = behavioral_signature.confidence
-        rel_confidence = sum(r.confidence for r in relationships) / len(relationships) if relationships else 0.0
+        if rel_confidence is None:
+            rel_confidence = sum(r.confidence for r in relationships) / len(relationships) if relationships else 0.0
         forecast_confidence = threat_forecast.overall_risk_score
         
         # Weighted average
@@ -336,6 +534,47 @@ class ABCCompilationEngine:
             generate_receipt=generate_receipt
         )
 
+    
+    def compile_federal_ai_intelligence_batch(
+        self,
+        agency_payloads: List[Dict[str, Any]],
+        workers: Optional[int] = None
+    ) -> List[CompiledIntelligence]:
+        """
+        Compile federal AI intelligence for many agencies across CPU cores
+        
+        Args:
+            agency_payloads: Keyword arguments for compile_federal_ai_intelligence,
+                one dict per agency
+            workers: Worker processes to use (default: one per CPU core;
+                1 forces in-process compilation)
+            
+        Returns:
+            CompiledIntelligence in the same order as agency_payloads
+        """
+        workers = workers or os.cpu_count() or 1
+        if len(agency_payloads) < _PROCESS_POOL_MIN_AGENCIES or workers <= 1:
+            return [self.compile_federal_ai_intelligence(**payload) for payload in agency_payloads]
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(agency_payloads))) as executor:
+            return list(executor.map(_compile_federal_ai_worker, agency_payloads))
+
+
+# Engine shared by the compile_intelligence convenience function; components
+# hold no per-compilation state, so one instance serves every caller
+_ENGINE: Optional[ABCCompilationEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def _get_engine() -> ABCCompilationEngine:
+    """Shared compilation engine, constructed on first use"""
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                _ENGINE = ABCCompilationEngine()
+    return _ENGINE
+
 
 # Convenience function for quick compilation
 def compile_intelligence(
@@ -356,8 +595,7 @@ def compile_intelligence(
             transaction_data=[...]
         )
     """
-    engine = ABCCompilationEngine()
-    return engine.compile_intelligence(
+    return _get_engine().compile_intelligence(
         actor_id=actor_id,
         actor_name=actor_name,
         raw_intelligence=raw_intelligence,
@@ -365,3 +603,7 @@ def compile_intelligence(
         network_data=network_data
     )
 
+
+def _compile_federal_ai_worker(payload: Dict[str, Any]) -> CompiledIntelligence:
+    """Compile one agency; top-level so it can run as a process-pool worker"""
+    return _get_engine().compile_federal_ai_intelligence(**payload)
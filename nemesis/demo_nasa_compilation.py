@@ -5,17 +5,46 @@ Demonstrates real-time federal AI threat compilation with NASA data
 Copyright (c) 2025 GH Systems. All rights reserved.
 """
 
+import asyncio
+import sys
 import time
 import requests
 import json
 from datetime import datetime
+from typing import Any, Dict, List, Tuple
 
 from nemesis.compilation_engine import ABCCompilationEngine
-from nemesis.signal_intake.federal_ai_monitor import FederalAIMonitor
+from nemesis.signal_intake.federal_ai_monitor import FederalAIMonitor, FederalAISystem
 from nemesis.on_chain_receipt.bitcoin_integration import BitcoinOnChainIntegration
 from nemesis.on_chain_receipt.receipt_verifier import ReceiptVerifier
 
 
+# Bound on items waiting between pipeline stages
+_PIPELINE_QUEUE_SIZE = 2
+
+
+def _compilation_inputs(
+    systems: List[FederalAISystem]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Split scanned systems into compile_federal_ai_intelligence inputs"""
+    vulnerability_data = []
+    ai_system_data = {}
+    for system in systems:
+        ai_system_data[system.system_name] = {
+            "type": system.system_type,
+            "endpoint": system.endpoint,
+            "agency": system.agency
+        }
+        for vuln in system.vulnerabilities:
+            vulnerability_data.append({
+                "type": vuln["type"],
+                "severity": vuln["severity"],
+                "description": vuln["description"],
+                "confidence": vuln.get("confidence", 0.5)
+            })
+    return ai_system_data, vulnerability_data
+
+
 def demo_nasa_compilation():
     """Live demo of NASA AI compilation"""
     
@@ -59,21 +88,7 @@ def demo_nasa_compilation():
     start_time = time.time()
     
     # Extract vulnerability data
-    vulnerability_data = []
-    ai_system_data = {}
-    for system in nasa_systems:
-        ai_system_data[system.system_name] = {
-            "type": system.system_type,
-            "endpoint": system.endpoint,
-            "agency": system.agency
-        }
-        for vuln in system.vulnerabilities:
-            vulnerability_data.append({
-                "type": vuln["type"],
-                "severity": vuln["severity"],
-                "description": vuln["description"],
-                "confidence": vuln.get("confidence", 0.5)
-            })
+    ai_system_data, vulnerability_data = _compilation_inputs(nasa_systems)
     
     # Compile federal AI intelligence
     compiled = compilation_engine.compile_federal_ai_intelligence(
@@ -171,6 +186,94 @@ def demo_nasa_compilation():
     print("=" * 60)
 
 
+async def _federal_pipeline() -> List[Dict[str, Any]]:
+    """
+    Scan, compile and submit each agency as a three-stage pipeline
+    
+    Stages are connected by bounded queues, so the next agency's scan and the
+    previous agency's receipt submission overlap with the current compilation.
+    """
+    compilation_engine = ABCCompilationEngine()
+    federal_monitor = FederalAIMonitor()
+    bitcoin_integration = BitcoinOnChainIntegration()
+    agencies = [
+        ("NASA", federal_monitor.scan_nasa_systems),
+        ("DoD", federal_monitor.scan_dod_systems),
+        ("DHS", federal_monitor.scan_dhs_systems)
+    ]
+    to_compile = asyncio.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+    to_submit = asyncio.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+    results = []
+    
+    async def scanner():
+        for agency, scan in agencies:
+            systems = await asyncio.to_thread(scan)
+            print(f"  🔍 {agency}: {len(systems)} systems scanned")
+            await to_compile.put((agency, systems))
+        await to_compile.put(None)
+    
+    async def compiler():
+        loop = asyncio.get_running_loop()
+        while (item := await to_compile.get()) is not None:
+            agency, systems = item
+            ai_system_data, vulnerability_data = _compilation_inputs(systems)
+            compiled = await loop.run_in_executor(
+                None,
+                compilation_engine.compile_federal_ai_intelligence,
+                agency,
+                ai_system_data,
+                vulnerability_data,
+                True
+            )
+            print(f"  ⚡ {agency}: compiled in {compiled.compilation_time_ms:.2f}ms")
+            await to_submit.put((agency, compiled))
+        await to_submit.put(None)
+    
+    async def submitter():
+        # Bitcoin RPC is a blocking client call, so it runs off the event loop
+        while (item := await to_submit.get()) is not None:
+            agency, compiled = item
+            receipt = compiled.targeting_package.get("receipt")
+            tx_result = None
+            if receipt:
+                try:
+                    tx_result = await asyncio.to_thread(
+                        bitcoin_integration.submit_receipt_to_blockchain, receipt
+                    )
+                    print(f"  ₿ {agency}: TX {tx_result.get('tx_hash')}")
+                except Exception as e:
+                    print(f"  ⚠️  {agency}: Bitcoin submission error: {e}")
+            results.append({"agency": agency, "compiled": compiled, "tx_result": tx_result})
+    
+    try:
+        await asyncio.gather(scanner(), compiler(), submitter())
+    finally:
+        compilation_engine.close()
+    return results
+
+
+def demo_federal_pipeline():
+    """Demo of pipelined multi-agency compilation (NASA, DoD, DHS)"""
+    print("=" * 60)
+    print("ABC FEDERAL AI SECURITY - PIPELINED MULTI-AGENCY DEMO")
+    print("=" * 60)
+    print()
+    
+    start_time = time.time()
+    results = asyncio.run(_federal_pipeline())
+    total_time = (time.time() - start_time) * 1000
+    
+    print()
+    print(f"✅ Agencies compiled: {len(results)}")
+    print(f"✅ Receipts submitted: {sum(1 for r in results if r['tx_result'])}")
+    print(f"✅ Total pipeline time: {total_time:.2f}ms")
+    print()
+    print("=" * 60)
+
+
 if __name__ == "__main__":
-    demo_nasa_compilation()
+    if "--pipeline" in sys.argv[1:]:
+        demo_federal_pipeline()
+    else:
+        demo_nasa_compilation()
 
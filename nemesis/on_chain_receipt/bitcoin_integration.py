@@ -7,13 +7,37 @@ Copyright (c) 2025 GH Systems. All rights reserved.
 
 import hashlib
 import json
-from typing import Dict, Any, Optional
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dataclasses import asdict
 
+from .merkle_tree import MerkleTree
+
 # Note: In production, use a proper Bitcoin library like python-bitcoinlib or bitcoinrpc
 # This is a simplified implementation for demonstration
 
+# OP_RETURN payload layout: receipt_id (32) + intelligence_hash (32) +
+# timestamp (8, big-endian) + metadata (8); string fields are NUL-padded
+_OP_RETURN_LAYOUT = struct.Struct(">32s32sQ8s")
+
+# Batch OP_RETURN payload: Merkle root (32) + receipt count (8) + reserved (40)
+_BATCH_OP_RETURN_LAYOUT = struct.Struct(">32sQ40x")
+
+# Metadata codes (in production, use more sophisticated encoding)
+_THREAT_CODES = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+_PACKAGE_TYPE_CODES = {"targeting_package": 0, "dossier": 1, "forecast": 2}
+
+# Every known (threat_level, package_type) pair pre-encoded as its 8 metadata
+# bytes: threat code (1) + type code (1) + reserved (6)
+_METADATA_TABLE = {
+    (threat_level, package_type): bytes([threat_code, type_code]) + b'\x00' * 6
+    for threat_level, threat_code in _THREAT_CODES.items()
+    for package_type, type_code in _PACKAGE_TYPE_CODES.items()
+}
+
 
 class BitcoinOnChainIntegration:
     """
@@ -58,6 +82,89 @@ class BitcoinOnChainIntegration:
         # Create transaction
         tx_result = self._create_op_return_transaction(receipt_data, fee_rate)
         
+        return self._submission_result(receipt, tx_result)
+    
+    def submit_receipts_batch(
+        self,
+        receipts: List[Dict[str, Any]],
+        fee_rate: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit several receipts, preparing each payload during the previous RPC
+        
+        Args:
+            receipts: IntelligenceReceipt dictionaries, submitted in order
+            fee_rate: Satoshis per byte (if None, uses network fee)
+            
+        Returns:
+            Transaction result per receipt, in input order
+        """
+        results = []
+        if not receipts:
+            return results
+        
+        # One worker prepares the next OP_RETURN payload while an RPC is in
+        # flight; it lives only for this batch
+        with ThreadPoolExecutor(max_workers=1) as prep_pool:
+            pending = prep_pool.submit(self._prepare_op_return_data, receipts[0])
+            for i, receipt in enumerate(receipts):
+                receipt_data = pending.result()
+                if i + 1 < len(receipts):
+                    pending = prep_pool.submit(self._prepare_op_return_data, receipts[i + 1])
+                tx_result = self._create_op_return_transaction(receipt_data, fee_rate)
+                results.append(self._submission_result(receipt, tx_result))
+        
+        return results
+    
+    def submit_merkle_batch(
+        self,
+        receipts: List[Dict[str, Any]],
+        fee_rate: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Commit many receipts with one OP_RETURN transaction via a Merkle root
+        
+        Each leaf is the SHA-256 of the receipt's own 80-byte OP_RETURN
+        payload, so the batch commits to exactly what single submissions
+        would. Each receipt dict gets its Merkle proof under "merkle_proof"
+        (kept off-chain) for later verification against the root.
+        
+        Args:
+            receipts: IntelligenceReceipt dictionaries
+            fee_rate: Satoshis per byte (if None, uses network fee)
+            
+        Returns:
+            Transaction result with tx_hash, merkle_root and receipt_count
+        """
+        if not receipts:
+            raise ValueError("No receipts to submit")
+        
+        leaf_hashes = [
+            hashlib.sha256(self._prepare_op_return_data(receipt)).hexdigest()
+            for receipt in receipts
+        ]
+        tree = MerkleTree(receipts, leaf_hashes=leaf_hashes)
+        merkle_root = tree.get_root_hash()
+        
+        batch_data = _BATCH_OP_RETURN_LAYOUT.pack(bytes.fromhex(merkle_root), len(receipts))
+        tx_result = self._create_op_return_transaction(batch_data, fee_rate)
+        
+        for i, receipt in enumerate(receipts):
+            receipt["merkle_proof"] = tree.generate_proof(i)
+        
+        return {
+            "status": "submitted",
+            "tx_hash": tx_result.get("tx_hash"),
+            "merkle_root": merkle_root,
+            "receipt_count": len(receipts),
+            "timestamp": datetime.now().isoformat(),
+            "network": self.network,
+            "block_height": tx_result.get("block_height"),
+            "confirmation_count": 0
+        }
+    
+    def _submission_result(self, receipt: Dict[str, Any], tx_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Submission summary for a receipt and its OP_RETURN transaction"""
         return {
             "status": "submitted",
             "tx_hash": tx_result.get("tx_hash"),
@@ -79,36 +186,37 @@ class BitcoinOnChainIntegration:
         - metadata (8 bytes)
         """
         # Extract key fields
-        receipt_id = receipt.get("receipt_id", "")[:32].encode('utf-8').ljust(32, b'\x00')
-        intelligence_hash = receipt.get("intelligence_hash", "")[:32].encode('utf-8').ljust(32, b'\x00')
+        receipt_id = receipt.get("receipt_id", "")[:32].encode('utf-8')
+        intelligence_hash = receipt.get("intelligence_hash", "")[:32].encode('utf-8')
         
-        # Timestamp (Unix timestamp as 8 bytes)
-        timestamp_str = receipt.get("timestamp", datetime.now().isoformat())
-        timestamp = int(datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')).timestamp())
-        timestamp_bytes = timestamp.to_bytes(8, byteorder='big')
+        # Timestamp (Unix timestamp as 8 bytes); receipts carry it as epoch_s,
+        # so the ISO string is only parsed for receipts issued without it
+        timestamp = receipt.get("epoch_s")
+        if timestamp is None:
+            timestamp_str = receipt.get("timestamp")
+            if timestamp_str is None:
+                timestamp = int(time.time())
+            else:
+                timestamp = int(datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')).timestamp())
         
         # Metadata (8 bytes: threat_level + package_type encoding)
         metadata = self._encode_metadata(receipt)
         
-        # Combine (80 bytes total)
-        op_return_data = receipt_id + intelligence_hash + timestamp_bytes + metadata
-        
-        return op_return_data[:80]  # Ensure max 80 bytes
+        # Packed straight into one 80-byte buffer; each string field is
+        # padded or cut to its 32-byte slot
+        return _OP_RETURN_LAYOUT.pack(receipt_id, intelligence_hash, timestamp, metadata)
     
     def _encode_metadata(self, receipt: Dict[str, Any]) -> bytes:
         """Encode metadata into 8 bytes"""
         threat_level = receipt.get("threat_level", "low")
         package_type = receipt.get("package_type", "targeting_package")
         
-        # Simple encoding (in production, use more sophisticated encoding)
-        threat_map = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-        type_map = {"targeting_package": 0, "dossier": 1, "forecast": 2}
-        
-        threat_code = threat_map.get(threat_level, 0)
-        type_code = type_map.get(package_type, 0)
-        
-        # 8 bytes: threat_level (1) + type (1) + reserved (6)
-        metadata = bytes([threat_code, type_code]) + b'\x00' * 6
+        metadata = _METADATA_TABLE.get((threat_level, package_type))
+        if metadata is None:
+            # Unknown values encode as code 0, as for the known pairs
+            threat_code = _THREAT_CODES.get(threat_level, 0)
+            type_code = _PACKAGE_TYPE_CODES.get(package_type, 0)
+            metadata = bytes([threat_code, type_code]) + b'\x00' * 6
         
         return metadata
     
@@ -121,8 +229,11 @@ class BitcoinOnChainIntegration:
         # Mock implementation - in production, use actual Bitcoin RPC
         # This demonstrates the structure
         
-        # Generate mock transaction hash
-        tx_hash = hashlib.sha256(op_return_data + datetime.now().isoformat().encode()).hexdigest()
+        # Generate mock transaction hash over payload + nanosecond clock, fed
+        # to the hash incrementally rather than concatenated first
+        tx_digest = hashlib.sha256(op_return_data)
+        tx_digest.update(time.time_ns().to_bytes(8, byteorder='big'))
+        tx_hash = tx_digest.hexdigest()
         
         return {
             "tx_hash": tx_hash,
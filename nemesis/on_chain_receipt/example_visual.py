@@ -111,13 +111,14 @@ def generate_visual_example():
     print("On-Chain Size: ~400 bytes")
     print()
     
-    # Verify receipt
-    is_valid = generator.verify_receipt(receipt, intelligence_package)
+    # Verify receipt (package hashed once, shared by both checks)
+    package_hash = generator._hash_intelligence_package(intelligence_package)
+    is_valid = generator.verify_receipt(receipt, intelligence_package, package_hash=package_hash)
     
     print("✅ VERIFICATION")
     print("-" * 80)
     print(f"Receipt Valid: {is_valid}")
-    print(f"Hash Matches: {receipt.intelligence_hash == generator._hash_intelligence_package(intelligence_package)}")
+    print(f"Hash Matches: {receipt.intelligence_hash == package_hash}")
     print()
     print("Anyone can verify:")
     print("  ✓ Intelligence came from GH Systems")
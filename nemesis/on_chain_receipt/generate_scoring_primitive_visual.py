@@ -3,14 +3,42 @@ Generate PNG Visual: Scoring Primitives Examples
 Shows actual scoring primitives that become verifiable
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle, FancyBboxPatch, FancyArrowPatch
 import json
+import sys
+import os
 
-def generate_scoring_primitive_visual(output_path="nemesis/on_chain_receipt/scoring_primitive_example.png"):
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from nemesis.on_chain_receipt.visual_cache import RENDER_DIGEST_KEY, render_digest, is_rendered
+
+def generate_scoring_primitive_visual(
+    output_path="nemesis/on_chain_receipt/scoring_primitive_example.png",
+    dpi=300,
+    fig=None,
+    force=False
+):
     """Generate visual showing example scoring primitives"""
     
-    fig, ax = plt.subplots(1, 1, figsize=(16, 9))
+    # The diagram is built from literals, so the PNG shipped alongside this
+    # module is reused while current; force (--regen) always re-renders
+    digest = render_digest(__file__, dpi=dpi)
+    if not force and is_rendered(output_path, digest):
+        print(f"✓ Visual up to date: {output_path}")
+        return output_path
+    
+    # Object-oriented Figure (no pyplot global state); a passed-in figure is
+    # cleared and reused so back-to-back renders skip figure/canvas setup
+    if fig is None:
+        fig = Figure(figsize=(16, 9))
+        FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+        fig.set_size_inches(16, 9)
+    ax = fig.add_subplot(1, 1, 1)
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -94,17 +122,15 @@ def generate_scoring_primitive_visual(output_path="nemesis/on_chain_receipt/scor
         ('Threat Level:', 'critical')
     ]
     
-    y_start = 6.2
-    for i, (label, value) in enumerate(receipt_items):
-        ax.text(7.5, y_start - i*0.5, f'{label} {value}', 
-                ha='center', va='center',
-                fontsize=10, color='#ffffff', alpha=0.9,
-                family='monospace')
+    # One text artist for the block; linespacing 3.15 keeps the 0.5-unit row pitch
+    ax.text(7.5, 5.2, '\n'.join(f'{label} {value}' for label, value in receipt_items),
+            ha='center', va='center', multialignment='center', linespacing=3.15,
+            fontsize=10, color='#ffffff', alpha=0.9, family='monospace')
     
     # Verification checkmark
-    check_circle = plt.Circle((7.5, 3.5), 0.5, 
-                             facecolor='#00ff88', edgecolor='#ffffff', 
-                             linewidth=2, zorder=11)
+    check_circle = Circle((7.5, 3.5), 0.5, 
+                          facecolor='#00ff88', edgecolor='#ffffff', 
+                          linewidth=2, zorder=11)
     ax.add_patch(check_circle)
     ax.text(7.5, 3.5, '✓', ha='center', va='center',
             fontsize=24, fontweight='bold', color='#0a0a0a')
@@ -129,13 +155,14 @@ def generate_scoring_primitive_visual(output_path="nemesis/on_chain_receipt/scor
     ax.text(5, 0.3, 'GH SYSTEMS', ha='center', va='center',
             fontsize=10, color='#666666', style='italic')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='#0a0a0a')
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='#0a0a0a',
+                metadata={RENDER_DIGEST_KEY: digest})
     print(f"✓ Visual saved to: {output_path}")
     return output_path
 
 
 if __name__ == "__main__":
-    output = generate_scoring_primitive_visual()
+    output = generate_scoring_primitive_visual(force="--regen" in sys.argv[1:])
     print(f"\n✓ Scoring primitive example visual generated: {output}")
 
@@ -3,15 +3,43 @@ Generate PNG Visual: Verifiable Scoring Primitives
 Creates a visual diagram showing off-chain vs on-chain comparison
 """
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+from matplotlib.patches import Circle, FancyBboxPatch, FancyArrowPatch
 import json
+import sys
+import os
 
-def generate_visual_png(output_path="nemesis/on_chain_receipt/verifiable_scoring_visual.png"):
+# Add parent directories to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from nemesis.on_chain_receipt.visual_cache import RENDER_DIGEST_KEY, render_digest, is_rendered
+
+def generate_visual_png(
+    output_path="nemesis/on_chain_receipt/verifiable_scoring_visual.png",
+    dpi=300,
+    fig=None,
+    force=False
+):
     """Generate PNG visual diagram - Simple and eye-catching"""
     
-    fig, ax = plt.subplots(1, 1, figsize=(16, 9))
+    # The diagram is built from literals, so the PNG shipped alongside this
+    # module is reused while current; force (--regen) always re-renders
+    digest = render_digest(__file__, dpi=dpi)
+    if not force and is_rendered(output_path, digest):
+        print(f"✓ Visual up to date: {output_path}")
+        return output_path
+    
+    # Object-oriented Figure (no pyplot global state); a passed-in figure is
+    # cleared and reused so back-to-back renders skip figure/canvas setup
+    if fig is None:
+        fig = Figure(figsize=(16, 9))
+        FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+        fig.set_size_inches(16, 9)
+    ax = fig.add_subplot(1, 1, 1)
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -53,7 +81,7 @@ def generate_visual_png(output_path="nemesis/on_chain_receipt/verifiable_scoring
     ax.add_patch(arrow)
     
     # Reduction badge on arrow - make it more visible and clear
-    reduction_circle = plt.Circle((5, 5.5), 0.7, facecolor='#ff0066', edgecolor='#ffffff', linewidth=2, zorder=11)
+    reduction_circle = Circle((5, 5.5), 0.7, facecolor='#ff0066', edgecolor='#ffffff', linewidth=2, zorder=11)
     ax.add_patch(reduction_circle)
     ax.text(5, 5.4, '99.98%', ha='center', va='center',
             fontsize=16, fontweight='bold', color='#ffffff')
@@ -97,13 +125,14 @@ def generate_visual_png(output_path="nemesis/on_chain_receipt/verifiable_scoring
     ax.text(5, 0.5, 'GH SYSTEMS', ha='center', va='center',
             fontsize=12, color='#666666', style='italic')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='#0a0a0a')
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='#0a0a0a',
+                metadata={RENDER_DIGEST_KEY: digest})
     print(f"✓ Visual saved to: {output_path}")
     return output_path
 
 
 if __name__ == "__main__":
-    output = generate_visual_png()
+    output = generate_visual_png(force="--regen" in sys.argv[1:])
     print(f"\n✓ PNG visual generated: {output}")
 
@@ -17,6 +17,7 @@ class MerkleNode:
         self.left = left
         self.right = right
         self.data = data  # Only leaf nodes have data
+        self.parent: Optional['MerkleNode'] = None  # Set when paired into the next level
 
 
 class MerkleTree:
@@ -25,27 +26,33 @@ class MerkleTree:
     Enables selective disclosure: reveal "We knew about Wallet X" without revealing "We also know about Wallet Y"
     """
     
-    def __init__(self, receipts: List[Dict[str, Any]]):
+    def __init__(self, receipts: List[Dict[str, Any]], leaf_hashes: Optional[List[str]] = None):
         """
         Initialize Merkle tree from receipts
         
         Args:
             receipts: List of receipt dictionaries (must have 'intelligence_hash' field)
+            leaf_hashes: Hex leaf hash per receipt, overriding intelligence_hash
+                (e.g. hashes of each receipt's on-chain payload)
         """
         self.receipts = receipts
-        self.root = self._build_tree(receipts)
         self.leaf_nodes: List[MerkleNode] = []
+        self.root = self._build_tree(receipts, leaf_hashes)
     
-    def _build_tree(self, receipts: List[Dict[str, Any]]) -> Optional[MerkleNode]:
+    def _build_tree(
+        self,
+        receipts: List[Dict[str, Any]],
+        leaf_hashes: Optional[List[str]] = None
+    ) -> Optional[MerkleNode]:
         """Build Merkle tree from receipts"""
         if not receipts:
             return None
         
         # Create leaf nodes (one per receipt)
         leaves = []
-        for receipt in receipts:
+        for i, receipt in enumerate(receipts):
             # Use intelligence_hash as leaf hash
-            intelligence_hash = receipt.get('intelligence_hash', '')
+            intelligence_hash = leaf_hashes[i] if leaf_hashes is not None else receipt.get('intelligence_hash', '')
             if not intelligence_hash:
                 # Generate hash from receipt if intelligence_hash not present
                 intelligence_hash = self._hash_receipt(receipt)
@@ -71,6 +78,7 @@ class MerkleTree:
                     # Combine hashes
                     combined_hash = self._hash_pair(left.hash, right.hash)
                     parent = MerkleNode(combined_hash, left, right)
+                    left.parent = right.parent = parent
                 else:
                     # Odd number of nodes, promote left
                     parent = left
@@ -151,10 +159,9 @@ class MerkleTree:
     
     def _find_parent(self, node: MerkleNode) -> Optional[MerkleNode]:
         """Find parent of a node (helper for proof generation)"""
-        # In a proper implementation, we'd maintain parent pointers
-        # For now, this is a simplified version
-        # In production, use a more efficient tree structure
-        return None  # Placeholder - would need full tree traversal
+        # Parent pointers are set while building; a node promoted past an odd
+        # level keeps the parent it is eventually paired under
+        return node.parent
     
     def verify_proof(
         self,
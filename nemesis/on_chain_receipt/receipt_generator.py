@@ -10,6 +10,36 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    # Optional dependency: receipt export/import fall back to the stdlib json module
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    # Optional dependency: new receipts fall back to SHA-256 intelligence hashes
+    blake3 = None
+
+# Hash algorithm for new receipts. BLAKE3 (SIMD) is fastest on multi-MB
+# packages; without it SHA-256 stays the default, since on CPUs with SHA
+# extensions it outruns BLAKE2b
+_DEFAULT_HASH_ALGO = "blake3" if blake3 is not None else "sha256"
+
+
+def _package_digest(data: bytes, hash_algo: str) -> str:
+    """Hex digest (32 bytes) of data under a receipt hash algorithm"""
+    if hash_algo == "sha256":
+        return hashlib.sha256(data).hexdigest()
+    if hash_algo == "blake2b":
+        return hashlib.blake2b(data, digest_size=32).hexdigest()
+    if hash_algo == "blake3":
+        if blake3 is None:
+            raise ImportError("blake3 package required for blake3 intelligence hashes")
+        return blake3.blake3(data).hexdigest()
+    raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
+
 
 class ReceiptStatus(Enum):
     """Receipt status"""
@@ -19,7 +49,7 @@ class ReceiptStatus(Enum):
     INVALID = "invalid"
 
 
-@dataclass
+@dataclass(slots=True)
 class IntelligenceReceipt:
     """
     Minimal cryptographic receipt of intelligence output
@@ -35,6 +65,8 @@ class IntelligenceReceipt:
     tx_hash: Optional[str] = None  # Bitcoin transaction hash (when committed)
     status: str = ReceiptStatus.PENDING.value
     metadata: Dict[str, Any] = None  # Minimal metadata (no proprietary info)
+    epoch_s: Optional[int] = None  # timestamp as Unix seconds (OP_RETURN encoding)
+    hash_algo: str = "sha256"  # Algorithm behind intelligence_hash (older receipts: SHA-256)
     
     def __post_init__(self):
         if self.metadata is None:
@@ -51,16 +83,25 @@ class CryptographicReceiptGenerator:
     receive intelligence from GH Systems—creating a bidirectional intelligence flow.
     """
     
-    def __init__(self, private_key: Optional[str] = None, licensee_id: Optional[str] = None):
+    def __init__(
+        self,
+        private_key: Optional[str] = None,
+        licensee_id: Optional[str] = None,
+        hash_algo: Optional[str] = None
+    ):
         """
         Initialize receipt generator
         
         Args:
             private_key: Private key for signing receipts (if None, uses mock signing)
             licensee_id: Licensee identifier (if generating receipts for licensee contributions)
+            hash_algo: Intelligence hash algorithm for new receipts
+                (sha256, blake2b or blake3; defaults to blake3 when installed, else sha256)
         """
         self.private_key = private_key
         self.licensee_id = licensee_id
+        self.hash_algo = hash_algo or _DEFAULT_HASH_ALGO
+        _package_digest(b"", self.hash_algo)  # Fail fast on an unusable algorithm
         self.receipt_version = "1.0.0"
     
     def generate_receipt(
@@ -84,8 +125,10 @@ class CryptographicReceiptGenerator:
         Returns:
             IntelligenceReceipt with cryptographic proof
         """
-        # Generate hash of full intelligence package
-        intelligence_hash = self._hash_intelligence_package(intelligence_package)
+        # Generate hash of full intelligence package; the canonical JSON is
+        # serialized once and also sizes the package below
+        package_json = self._canonical_package_json(intelligence_package)
+        intelligence_hash = _package_digest(package_json.encode('utf-8'), self.hash_algo)
         
         # Generate receipt ID
         receipt_id = self._generate_receipt_id(intelligence_hash)
@@ -93,7 +136,7 @@ class CryptographicReceiptGenerator:
         # Create minimal metadata (no proprietary info)
         metadata = {
             "version": self.receipt_version,
-            "package_size": len(json.dumps(intelligence_package)),
+            "package_size": len(package_json),
             "generated_at": datetime.now().isoformat()
         }
         
@@ -109,23 +152,33 @@ class CryptographicReceiptGenerator:
         signature = self._sign_receipt(receipt_id, intelligence_hash, metadata)
         
         # Create receipt
+        issued_at = datetime.now()
         receipt = IntelligenceReceipt(
             receipt_id=receipt_id,
             intelligence_hash=intelligence_hash,
-            timestamp=datetime.now().isoformat(),
+            timestamp=issued_at.isoformat(),
             actor_id=actor_id,
             threat_level=threat_level,
             package_type=package_type,
             gh_systems_signature=signature,
             status=ReceiptStatus.PENDING.value,
-            metadata=metadata
+            metadata=metadata,
+            epoch_s=int(issued_at.timestamp()),
+            hash_algo=self.hash_algo
         )
         
         return receipt
     
-    def _hash_intelligence_package(self, package: Dict[str, Any]) -> str:
+    def _hash_intelligence_package(
+        self,
+        package: Dict[str, Any],
+        hash_algo: Optional[str] = None
+    ) -> str:
         """
-        Generate SHA-256 hash of intelligence package using canonical JSON
+        Generate hash of intelligence package using canonical JSON
+        
+        hash_algo selects the primitive (defaults to this generator's); pass a
+        receipt's hash_algo when verifying it.
         
         CRITICAL: Uses canonical JSON representation to ensure hash consistency
         - sort_keys=True: Deterministic key ordering
@@ -133,14 +186,20 @@ class CryptographicReceiptGenerator:
         - separators=(',', ':'): No extra whitespace
         - No formatting changes (whitespace) should affect hash
         """
-        # Canonical JSON: sort keys, no extra whitespace, consistent encoding
-        package_json = json.dumps(
+        package_json = self._canonical_package_json(package)
+        return _package_digest(package_json.encode('utf-8'), hash_algo or self.hash_algo)
+    
+    def _canonical_package_json(self, package: Dict[str, Any]) -> str:
+        """Canonical JSON of an intelligence package (the hash input)"""
+        # Canonical JSON: sort keys, no extra whitespace, consistent encoding.
+        # Always stdlib json: orjson formats some floats differently (1e-7 vs
+        # 1e-07), which would make the hash depend on what is installed
+        return json.dumps(
             package,
             sort_keys=True,
             ensure_ascii=False,
             separators=(',', ':')  # No extra whitespace
         )
-        return hashlib.sha256(package_json.encode('utf-8')).hexdigest()
     
     def _generate_receipt_id(self, intelligence_hash: str) -> str:
         """Generate unique receipt ID from intelligence hash"""
@@ -171,19 +230,32 @@ class CryptographicReceiptGenerator:
             sign_data = f"{receipt_id}{intelligence_hash}{json.dumps(metadata, sort_keys=True)}"
             return hashlib.sha256(sign_data.encode()).hexdigest()
     
-    def verify_receipt(self, receipt: IntelligenceReceipt, intelligence_package: Dict[str, Any]) -> bool:
+    def verify_receipt(
+        self,
+        receipt: IntelligenceReceipt,
+        intelligence_package: Dict[str, Any],
+        package_hash: Optional[str] = None
+    ) -> bool:
         """
         Verify that receipt matches intelligence package
         
         Args:
             receipt: IntelligenceReceipt to verify
             intelligence_package: Full intelligence package to verify against
+            package_hash: Hash of intelligence_package if the caller already has
+                it (from _hash_intelligence_package), to skip rehashing
             
         Returns:
             True if receipt is valid, False otherwise
         """
         # Verify hash matches
-        package_hash = self._hash_intelligence_package(intelligence_package)
+        if package_hash is None:
+            try:
+                package_hash = self._hash_intelligence_package(
+                    intelligence_package, receipt.hash_algo
+                )
+            except (ImportError, ValueError):
+                return False  # hash_algo unknown or unavailable on this host
         if package_hash != receipt.intelligence_hash:
             return False
         
@@ -213,6 +285,7 @@ class CryptographicReceiptGenerator:
         return {
             "receipt_id": receipt.receipt_id,
             "intelligence_hash": receipt.intelligence_hash,
+            "hash_algo": receipt.hash_algo,
             "timestamp": receipt.timestamp,
             "actor_id": receipt.actor_id,
             "threat_level": receipt.threat_level,
@@ -257,11 +330,14 @@ class CryptographicReceiptGenerator:
     
     def export_receipt_json(self, receipt: IntelligenceReceipt) -> str:
         """Export receipt as JSON string"""
+        if orjson is not None:
+            # Serializes the dataclass directly, no asdict() copy
+            return orjson.dumps(receipt, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(asdict(receipt), indent=2)
     
     def import_receipt_json(self, receipt_json: str) -> IntelligenceReceipt:
         """Import receipt from JSON string"""
-        data = json.loads(receipt_json)
+        data = orjson.loads(receipt_json) if orjson is not None else json.loads(receipt_json)
         return IntelligenceReceipt(**data)
     
     def generate_licensee_contribution_receipt(
@@ -7,7 +7,7 @@ Copyright (c) 2025 GH Systems. All rights reserved.
 
 import hashlib
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from dataclasses import asdict
 
@@ -63,9 +63,13 @@ class ReceiptVerifier:
         
         # Check 1: Receipt hash integrity
         if intelligence_package:
-            expected_hash = self.receipt_generator._hash_intelligence_package(intelligence_package)
+            expected_hash, hash_error = self._expected_hash(intelligence_package, receipt)
             actual_hash = receipt.get("intelligence_hash")
-            verification_result["checks"]["hash_integrity"] = expected_hash == actual_hash
+            verification_result["checks"]["hash_integrity"] = (
+                expected_hash is not None and expected_hash == actual_hash
+            )
+            if hash_error:
+                verification_result["hash_integrity_error"] = hash_error
         else:
             verification_result["checks"]["hash_integrity"] = None  # Cannot verify without package
         
@@ -137,16 +141,38 @@ class ReceiptVerifier:
             Verification result
         """
         # Generate expected hash
-        expected_hash = self.receipt_generator._hash_intelligence_package(intelligence_package)
+        expected_hash, hash_error = self._expected_hash(intelligence_package, receipt)
         actual_hash = receipt.get("intelligence_hash")
+        match = expected_hash is not None and expected_hash == actual_hash
         
-        return {
-            "verified": expected_hash == actual_hash,
+        result = {
+            "verified": match,
             "expected_hash": expected_hash,
             "actual_hash": actual_hash,
-            "match": expected_hash == actual_hash,
+            "match": match,
             "timestamp": datetime.now().isoformat()
         }
+        if hash_error:
+            result["error"] = hash_error
+        return result
+    
+    def _expected_hash(
+        self,
+        intelligence_package: Dict[str, Any],
+        receipt: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Hash of the package under the receipt's hash_algo, as (hash, error)
+        
+        Receipts from before hash_algo existed are SHA-256. An algorithm this
+        host cannot compute (unknown, or blake3 without the blake3 package)
+        yields (None, reason) rather than raising.
+        """
+        hash_algo = receipt.get("hash_algo", "sha256")
+        try:
+            return self.receipt_generator._hash_intelligence_package(intelligence_package, hash_algo), None
+        except (ImportError, ValueError) as e:
+            return None, f"Cannot verify {hash_algo} intelligence hash: {e}"
     
     def batch_verify_receipts(
         self,
@@ -0,0 +1,40 @@
+"""
+Render Cache for Receipt Visuals
+Skips Matplotlib rendering when the PNG on disk was drawn from the same inputs
+
+Copyright (c) 2025 GH Systems. All rights reserved.
+"""
+
+import hashlib
+import os
+from typing import Any
+
+from PIL import Image  # Matplotlib's own PNG dependency
+
+# PNG text chunk recording the digest a visual was rendered from
+RENDER_DIGEST_KEY = "Render-Digest"
+
+
+def render_digest(source_file: str, **options: Any) -> str:
+    """
+    Digest of everything a visual depends on
+
+    The diagrams are drawn entirely from literals in their renderer module, so
+    the module source plus the render options (dpi, ...) fully determine the PNG.
+    """
+    with open(source_file, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16)
+    digest.update(repr(sorted(options.items())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def is_rendered(output_path: str, digest: str) -> bool:
+    """Whether output_path is a PNG already rendered for this digest"""
+    if not os.path.exists(output_path):
+        return False
+    try:
+        with Image.open(output_path) as image:
+            # Text chunks sit before the image data, so info has them unloaded
+            return image.info.get(RENDER_DIGEST_KEY) == digest
+    except OSError:
+        return False